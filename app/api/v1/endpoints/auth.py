@@ -1,3 +1,4 @@
+import asyncio
 from datetime import timedelta
 from typing import Any
 
@@ -129,16 +130,25 @@ async def refresh_token(
             )
 
         user_id = int(payload.get("sub"))
-        user = await tortoise_user.get(user_id)
+
+        # The user lookup and the stored-token lookup are independent -
+        # run them concurrently instead of serializing the round-trips.
+        # Only the is_revoked flag is needed from the stored token, so
+        # project just that column instead of hydrating the full row
+        user, token_flags = await asyncio.gather(
+            tortoise_user.get_by_id(user_id),
+            RefreshToken.filter(
+                token=token_data.refresh_token, user_id=user_id
+            ).limit(1).values_list("is_revoked", flat=True),
+        )
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found"
             )
 
-        # Check if refresh token exists in database
-        refresh_token_obj = await RefreshToken.get_or_none(token=token_data.refresh_token, user=user)
-        if not refresh_token_obj or not refresh_token_obj.is_active:
+        # Reject unknown tokens and revoked ones alike
+        if not token_flags or token_flags[0]:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid refresh token"
@@ -147,13 +157,14 @@ async def refresh_token(
         # Create new access token
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = security.create_access_token(
-            data={"sub": str(user.id)}, expires_delta=access_token_expires
+            user.id, expires_delta=access_token_expires
         )
 
         return {
             "access_token": access_token,
             "refresh_token": token_data.refresh_token,
-            "token_type": "bearer"
+            "token_type": "bearer",
+            "expires_in": int(access_token_expires.total_seconds())
         }
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -174,16 +185,17 @@ async def logout(
     """
     Logout user by revoking refresh token.
     """
-    refresh_token_obj = await RefreshToken.get_or_none(token=token_data.refresh_token, user=current_user)
-    if refresh_token_obj:
-        refresh_token_obj.is_active = False
-        await refresh_token_obj.save()
+    # One UPDATE instead of fetch-then-save - the rowcount tells us whether
+    # the token existed, and there is no window between check and revoke
+    revoked_count = await RefreshToken.filter(
+        token=token_data.refresh_token, user=current_user
+    ).update(is_revoked=True)
+    if revoked_count:
         return {"message": "Successfully logged out"}
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Failed to logout"
-        )
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Failed to logout"
+    )
 
 
 @router.post("/logout-all")
@@ -194,12 +206,7 @@ async def logout_all(
     """
     Logout user from all devices by revoking all refresh tokens.
     """
-    refresh_tokens = await RefreshToken.filter(user=current_user, is_active=True)
-    revoked_count = 0
-    for token in refresh_tokens:
-        token.is_active = False
-        await token.save()
-        revoked_count += 1
+    revoked_count = await RefreshToken.filter(user=current_user, is_revoked=False).update(is_revoked=True)
     return {"message": f"Successfully logged out from {revoked_count} devices"}
 
 
@@ -213,15 +220,23 @@ async def change_password(
     Change user password.
     """
     try:
-        # Verify current password
-        if not security.verify_password(password_data.current_password, current_user.hashed_password):
+        # Verify current password (bcrypt is CPU-bound, keep it off the
+        # event loop)
+        password_ok = await asyncio.to_thread(
+            security.verify_password,
+            password_data.current_password,
+            current_user.hashed_password,
+        )
+        if not password_ok:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Incorrect current password"
             )
 
         # Update password
-        current_user.hashed_password = security.get_password_hash(password_data.new_password)
+        current_user.hashed_password = await asyncio.to_thread(
+            security.get_password_hash, password_data.new_password
+        )
         await current_user.save()
         return {"message": "Password changed successfully"}
     except Exception as e:
@@ -306,7 +321,9 @@ async def reset_password(
         )
 
     # Update password and clear reset token
-    user.hashed_password = security.get_password_hash(reset_data.new_password)
+    user.hashed_password = await asyncio.to_thread(
+        security.get_password_hash, reset_data.new_password
+    )
     user.password_reset_token = None
     await user.save()
 
@@ -1,3 +1,4 @@
+import logging
 from typing import Dict, Any, List, Optional
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, Path
@@ -7,6 +8,8 @@ from app.api.tortoise_deps import get_current_verified_user
 from app.models.models import User
 from app.services.travclan_api_service import travclan_api_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -86,10 +89,9 @@ async def create_direct_hotel_itinerary(
     Perfect for getting rates for user's existing bookings.
     """
     try:
-        # Convert dates to strings
-        request_data = request.model_dump()
-        request_data['checkIn'] = request.checkIn.isoformat()
-        request_data['checkOut'] = request.checkOut.isoformat()
+        # mode="json" emits dates as ISO strings during the single dump
+        # traversal, so no manual re-serialization pass is needed
+        request_data = request.model_dump(mode="json")
         
         async with travclan_api_service:
             response = await travclan_api_service.create_direct_hotel_itinerary(request_data)
@@ -108,16 +110,14 @@ async def create_direct_hotel_itinerary(
                     room_name = room_info.get('name', '')
                     
                     # Log room name for tracking and debugging
-                    import logging
-                    logging.getLogger(__name__).info(f"Room found in direct API: {room_name} for hotel {request.hotelId}")
+                    logger.info("Room found in direct API: %s for hotel %s", room_name, request.hotelId)
                     
                     # Here we can potentially match with existing rooms using fuzzy matching
                     # This is useful for updating room details with API-specific information
         
         except Exception as e:
             # Don't fail the API call if room processing fails
-            import logging
-            logging.getLogger(__name__).warning(f"Room processing failed for hotel {request.hotelId}: {e}")
+            logger.warning(f"Room processing failed for hotel {request.hotelId}: {e}")
         
         return {
             "status": "success",
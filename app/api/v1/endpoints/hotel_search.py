@@ -1,15 +1,39 @@
+import asyncio
+import logging
 from typing import Dict, Any, List, Optional
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel, Field, field_validator
 
 from app.api.tortoise_deps import get_optional_current_user, get_current_active_user
+from app.core.cache import get_cached_bytes, make_cache_key, set_cached_bytes
 from app.models.models import User
 from app.services.travclan_api_service import travclan_api_service
 from app.services.hotel_service import HotelService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# In-flight searches keyed by cache key - concurrent requests for the same
+# search share a single upstream call instead of each firing their own
+_inflight_searches: Dict[str, asyncio.Future] = {}
+
+# Facilities surfaced in processed results - a frozenset so the per-facility
+# membership test in process_hotel_results is a hash probe
+USEFUL_FACILITIES = frozenset({
+    'Free WiFi',
+    'Swimming Pool',
+    'Free Breakfast',
+    'Free Parking',
+    'Airport Shuttle',
+    'Fitness Facility',
+    'Spa',
+    'Restaurant',
+    'Laundry Services',
+})
+
 
 class OccupancyRequest(BaseModel):
     numOfAdults: int = Field(..., ge=1, le=10, description="Number of adults")
@@ -36,7 +60,6 @@ class HotelSearchRequest(BaseModel):
     @field_validator('checkIn')
     @classmethod
     def validate_check_in_future(cls, v):
-        from datetime import date
         if v and v <= date.today():
             raise ValueError('Check-in date must be in the future')
         return v
@@ -56,53 +79,56 @@ async def search_hotels(
     onlyFilter: Optional[bool] = Query(False, description="Only apply filters to existing results"),
     store_price_history: Optional[bool] = Query(True, description="Store price history data"),
     current_user: User = Depends(get_current_active_user),
-) -> Dict[str, Any]:
+) -> Response:
     """
     Search for hotels
-    
+
     Search for available hotels based on location, dates, and occupancy.
     Also stores price history data for tracking price changes over time.
     """
     try:
         # Convert request to dict for API service
         search_data = request.model_dump()
-        
+
         # Add filter data if provided
         if filterBy:
             search_data['filterBy'] = filterBy.model_dump(exclude_none=True)
-        
-        # Use async context manager for the API service
-        async with travclan_api_service:
-            response = await travclan_api_service.search_hotels(search_data)
-        
-        # Store price history data if enabled
-        stored_price_histories = []
-        if store_price_history:
-            try:
-                hotel_service = HotelService()
-                stored_price_histories = await hotel_service.process_hotel_search_results(
-                    search_request=search_data,
-                    search_response=response
-                )
-            except Exception as e:
-                # Log error but don't fail the search
-                import logging
-                logging.getLogger(__name__).error(f"Failed to store price history: {e}")
-        
-        # Process the results for API response
-        processed_data = process_hotel_results(response, current_user)
-        
-        # Apply filters if needed
-        if filterBy:
-            processed_data = apply_filters(processed_data, filterBy)
-        
-        # Add metadata about stored price histories
-        processed_data['price_histories_stored'] = len(stored_price_histories)
-        
-        return {
-            "status": "success",
-            "data": processed_data
-        }
+
+        # Serve repeated identical searches from Redis while the upstream
+        # data is still fresh - hotel rates don't change within a minute
+        cache_key = make_cache_key(
+            "hotel_search",
+            {**search_data, "onlyFilter": onlyFilter, "store_price_history": store_price_history},
+        )
+        # The cache stores the serialized body, so a hit ships the bytes
+        # straight back out without a parse/re-serialize round-trip
+        cached_body = await get_cached_bytes(cache_key)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json")
+
+        # If an identical search is already in flight, wait for its result
+        # instead of duplicating the upstream call
+        inflight = _inflight_searches.get(cache_key)
+        if inflight is not None:
+            return Response(content=await inflight, media_type="application/json")
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight_searches[cache_key] = future
+
+        try:
+            body = await _execute_search(
+                search_data, filterBy, store_price_history, current_user, cache_key
+            )
+            future.set_result(body)
+            return Response(content=body, media_type="application/json")
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # Mark the exception as retrieved in case nobody is waiting
+                future.exception()
+            raise
+        finally:
+            _inflight_searches.pop(cache_key, None)
 
     except HTTPException:
         raise
@@ -110,6 +136,56 @@ async def search_hotels(
         raise HTTPException(status_code=500, detail=f"Hotel search failed: {str(e)}")
 
 
+async def _execute_search(
+    search_data: Dict[str, Any],
+    filterBy: Optional[FilterByRequest],
+    store_price_history: bool,
+    current_user: User,
+    cache_key: str,
+) -> bytes:
+    """
+    Run a hotel search against the upstream API, store price history and
+    cache the serialized response body
+    """
+    # Use async context manager for the API service
+    async with travclan_api_service:
+        response = await travclan_api_service.search_hotels(search_data)
+
+    # Store price history data if enabled (skip the round-trip entirely
+    # for empty result pages - there is nothing to store)
+    stored_price_histories = []
+    has_results = bool(response.get('results', [{}])[0].get('data'))
+    if store_price_history and has_results:
+        try:
+            hotel_service = HotelService()
+            stored_price_histories = await hotel_service.process_hotel_search_results(
+                search_request=search_data,
+                search_response=response
+            )
+        except Exception as e:
+            # Log error but don't fail the search
+            logger.error(f"Failed to store price history: {e}")
+
+    # Process the results for API response
+    processed_data = process_hotel_results(response, current_user)
+
+    # Apply filters if needed
+    if filterBy:
+        processed_data = apply_filters(processed_data, filterBy)
+
+    # Add metadata about stored price histories
+    processed_data['price_histories_stored'] = len(stored_price_histories)
+
+    body = orjson.dumps({
+        "status": "success",
+        "data": processed_data
+    })
+
+    await set_cached_bytes(cache_key, body, ttl_seconds=60)
+
+    return body
+
+
 @router.get("/static-content/{hotel_id}")
 async def get_hotel_static_content(
     hotel_id: str,
@@ -139,68 +215,68 @@ def process_hotel_results(response: Dict[str, Any], user: User = None) -> Dict[s
     """
     Process hotel search results and format them
     """
-    useful_facilities = [
-        'Free WiFi',
-        'Swimming Pool', 
-        'Free Breakfast',
-        'Free Parking',
-        'Airport Shuttle',
-        'Fitness Facility',
-        'Spa',
-        'Restaurant',
-        'Laundry Services'
-    ]
-    
-    # Get initial filtered and processed results
-    raw_hotels = response.get('results', [{}])[0].get('data', [])
-    
-    # Filter available hotels with images
-    filtered_hotels = [
-        hotel for hotel in raw_hotels 
-        if hotel.get('isAvailable', False) and hotel.get('heroImage')
-    ]
-    
-    # Remove duplicates based on ID
-    unique_hotels = {}
-    for hotel in filtered_hotels:
-        hotel_id = hotel.get('id')
-        if hotel_id and hotel_id not in unique_hotels:
-            unique_hotels[hotel_id] = hotel
-    
+    first_result = response.get('results', [{}])[0]
+    raw_hotels = first_result.get('data', [])
+
+    # Availability filter, ID dedupe and formatting happen in one traversal
+    # of the raw list - the intermediate filtered list and dedupe dict the
+    # three-pass version allocated are gone. First occurrence of an ID wins,
+    # matching the previous dedupe semantics
+    seen_ids = set()
+    available_count = 0
     processed_results = []
-    for hotel in unique_hotels.values():
-        original_rate = hotel.get('availability', {}).get('rate', {}).get('finalRate', 0)
-        currency = hotel.get('availability', {}).get('rate', {}).get('currency', 'INR')
-        
+
+    for hotel in raw_hotels:
+        if not (hotel.get('isAvailable', False) and hotel.get('heroImage')):
+            continue
+        available_count += 1
+
+        hotel_id = hotel.get('id')
+        if not hotel_id or hotel_id in seen_ids:
+            continue
+        seen_ids.add(hotel_id)
+
+        # Resolve the nested sub-dicts once instead of re-walking the same
+        # get() chains for every field below
+        availability = hotel.get('availability', {})
+        rate = availability.get('rate', {})
+        options = availability.get('options', {})
+        geo = hotel.get('geoCode', {})
+        address = hotel.get('contact', {}).get('address', {})
+        first_review = hotel.get('reviews', [{}])[0]
+
+        original_rate = rate.get('finalRate', 0)
+        currency = rate.get('currency', 'INR')
+
         # Basic processing without external dependencies
         final_rate = original_rate
-        
-        processed_hotel = {
-            'id': hotel.get('id'),
+
+        processed_results.append({
+            'id': hotel_id,
             'name': hotel.get('name'),
             'star_rating': hotel.get('starRating'),
             'geoCode': {
-                'latitude': hotel.get('geoCode', {}).get('lat'),
-                'longitude': hotel.get('geoCode', {}).get('long')
+                'latitude': geo.get('lat'),
+                'longitude': geo.get('long')
             },
             'address': {
-                'line1': hotel.get('contact', {}).get('address', {}).get('line1'),
-                'line2': hotel.get('contact', {}).get('address', {}).get('line2'),
-                'city': hotel.get('contact', {}).get('address', {}).get('city', {}).get('name'),
-                'state': hotel.get('contact', {}).get('address', {}).get('state', {}).get('name'),
-                'country': hotel.get('contact', {}).get('address', {}).get('country', {}).get('name'),
-                'postal_code': hotel.get('contact', {}).get('address', {}).get('postalCode')
+                'line1': address.get('line1'),
+                'line2': address.get('line2'),
+                'city': address.get('city', {}).get('name'),
+                'state': address.get('state', {}).get('name'),
+                'country': address.get('country', {}).get('name'),
+                'postal_code': address.get('postalCode')
             },
             'facilities': [
                 facility.get('name') for facility in hotel.get('facilities', [])
-                if facility.get('name') in useful_facilities
+                if facility.get('name') in USEFUL_FACILITIES
             ],
             'reviews': {
-                'count': hotel.get('reviews', [{}])[0].get('count'),
-                'rating': hotel.get('reviews', [{}])[0].get('rating'),
+                'count': first_review.get('count'),
+                'rating': first_review.get('rating'),
                 'categories': {
                     category.get('category'): category.get('rating')
-                    for category in hotel.get('reviews', [{}])[0].get('categoryratings', [])
+                    for category in first_review.get('categoryratings', [])
                 }
             },
             'hero_image': hotel.get('heroImage'),
@@ -216,28 +292,26 @@ def process_hotel_results(response: Dict[str, Any], user: User = None) -> Dict[s
                 }
             },
             'options': {
-                'free_breakfast': hotel.get('availability', {}).get('options', {}).get('freeBreakfast', False),
-                'free_cancellation': hotel.get('availability', {}).get('options', {}).get('freeCancellation', False)
+                'free_breakfast': options.get('freeBreakfast', False),
+                'free_cancellation': options.get('freeCancellation', False)
             }
-        }
-        
-        processed_results.append(processed_hotel)
-    
+        })
+
     return {
         'message': response.get('message'),
         'error': response.get('error'),
         'code': response.get('code'),
-        'traceId': response.get('results', [{}])[0].get('traceId'),
-        'availableTypes': response.get('results', [{}])[0].get('availableTypes'),
-        'availableFacilities': response.get('results', [{}])[0].get('availableFacilities'),
-        'currentPage': response.get('results', [{}])[0].get('currentPage', 1),
-        'perPage': response.get('results', [{}])[0].get('perPage', 25),
-        'previousPage': response.get('results', [{}])[0].get('previousPage'),
-        'nextPage': response.get('results', [{}])[0].get('nextPage'),
-        'totalCount': response.get('results', [{}])[0].get('totalCount', 0),
-        'availableCount': response.get('results', [{}])[0].get('availableCount', 0),
-        'totalPages': response.get('results', [{}])[0].get('totalPages', 1),
-        'originalCount': len(filtered_hotels),
+        'traceId': first_result.get('traceId'),
+        'availableTypes': first_result.get('availableTypes'),
+        'availableFacilities': first_result.get('availableFacilities'),
+        'currentPage': first_result.get('currentPage', 1),
+        'perPage': first_result.get('perPage', 25),
+        'previousPage': first_result.get('previousPage'),
+        'nextPage': first_result.get('nextPage'),
+        'totalCount': first_result.get('totalCount', 0),
+        'availableCount': first_result.get('availableCount', 0),
+        'totalPages': first_result.get('totalPages', 1),
+        'originalCount': available_count,
         'filteredCount': len(processed_results),
         'results': processed_results
     }
@@ -248,47 +322,47 @@ def apply_filters(data: Dict[str, Any], filter_by: FilterByRequest) -> Dict[str,
     Apply filters to hotel search results
     """
     hotels = data.get('results', [])
-    
-    # Filter by price range
-    if filter_by.priceRange:
-        min_price = filter_by.priceRange.get('min', 0)
-        max_price = filter_by.priceRange.get('max', float('inf'))
-        
-        hotels = [
-            hotel for hotel in hotels
-            if min_price <= hotel.get('rates', {}).get('final_rate', 0) <= max_price
-        ]
-    
-    # Filter by star rating
-    if filter_by.starRatings:
-        hotels = [
-            hotel for hotel in hotels
-            if hotel.get('star_rating') in filter_by.starRatings
-        ]
-    
-    # Filter by facilities
-    if filter_by.facilities:
-        hotels = [
-            hotel for hotel in hotels
-            if all(facility in hotel.get('facilities', []) for facility in filter_by.facilities)
-        ]
-    
-    # Filter by rate options
-    if filter_by.rateOptions:
-        if filter_by.rateOptions.get('freeBreakfast'):
-            hotels = [
-                hotel for hotel in hotels
-                if hotel.get('options', {}).get('free_breakfast', False)
-            ]
-        
-        if filter_by.rateOptions.get('freeCancellation'):
-            hotels = [
-                hotel for hotel in hotels
-                if hotel.get('options', {}).get('free_cancellation', False)
-            ]
-    
+
+    # Resolve filter settings once, then apply every active predicate in a
+    # single pass instead of rebuilding the hotel list per filter
+    price_range = filter_by.priceRange
+    if price_range:
+        min_price = price_range.get('min', 0)
+        max_price = price_range.get('max', float('inf'))
+
+    rate_options = filter_by.rateOptions or {}
+    require_breakfast = rate_options.get('freeBreakfast', False)
+    require_cancellation = rate_options.get('freeCancellation', False)
+
+    filtered_hotels = []
+    for hotel in hotels:
+        # Filter by price range
+        if price_range:
+            final_rate = hotel.get('rates', {}).get('final_rate', 0)
+            if not min_price <= final_rate <= max_price:
+                continue
+
+        # Filter by star rating
+        if filter_by.starRatings and hotel.get('star_rating') not in filter_by.starRatings:
+            continue
+
+        # Filter by facilities
+        if filter_by.facilities:
+            hotel_facilities = hotel.get('facilities', [])
+            if not all(facility in hotel_facilities for facility in filter_by.facilities):
+                continue
+
+        # Filter by rate options
+        options = hotel.get('options', {})
+        if require_breakfast and not options.get('free_breakfast', False):
+            continue
+        if require_cancellation and not options.get('free_cancellation', False):
+            continue
+
+        filtered_hotels.append(hotel)
+
     # Update data with filtered results
-    data['results'] = hotels
-    data['filteredCount'] = len(hotels)
-    
+    data['results'] = filtered_hotels
+    data['filteredCount'] = len(filtered_hotels)
+
     return data
\ No newline at end of file
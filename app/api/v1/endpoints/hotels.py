@@ -43,6 +43,51 @@ SAMPLE_HOTELS = [
     }
 ]
 
+# Public projection of the sample hotels, computed once at import: the
+# anonymous tier always sees the same records minus the same fields, so
+# per-request filtering is pure repeated work. Index-aligned with
+# SAMPLE_HOTELS so handlers just pick the tier-appropriate list
+PUBLIC_FIELDS_EXCLUDED = frozenset({"available"})
+PUBLIC_HOTELS = [
+    {k: v for k, v in hotel.items() if k not in PUBLIC_FIELDS_EXCLUDED}
+    for hotel in SAMPLE_HOTELS
+]
+
+# By-id indexes so single-hotel lookups are a hash probe instead of a
+# linear scan over the sample list
+HOTELS_BY_ID = {hotel["id"]: hotel for hotel in SAMPLE_HOTELS}
+PUBLIC_HOTELS_BY_ID = {hotel["id"]: hotel for hotel in PUBLIC_HOTELS}
+
+# Built once at import - the offers shown to authenticated users are the
+# same for every request, so there is no reason to reallocate the list per
+# call
+SPECIAL_OFFERS = ["10% discount for verified users", "Free breakfast"]
+
+# Sample reviews (in production, fetch from database) - constant data, so
+# defined once rather than rebuilt inside the handler per request
+SAMPLE_REVIEWS = [
+    {
+        "id": 1,
+        "user": "John D.",
+        "rating": 5,
+        "comment": "Absolutely fantastic stay! Will definitely come back.",
+        "date": "2024-01-15"
+    },
+    {
+        "id": 2,
+        "user": "Sarah M.",
+        "rating": 4,
+        "comment": "Great location and service. Room could be bigger.",
+        "date": "2024-01-10"
+    }
+]
+
+POPULAR_DESTINATIONS = [
+    {"location": "Bali, Indonesia", "bookings": 342},
+    {"location": "New York, USA", "bookings": 289},
+    {"location": "Swiss Alps, Switzerland", "bookings": 156}
+]
+
 
 @router.get("/")
 async def get_hotels(
@@ -57,19 +102,30 @@ async def get_hotels(
     - Authenticated users get additional details
     - Public users get basic information only
     """
-    hotels = SAMPLE_HOTELS[skip : skip + limit]
-    
+    # Pick the tier-appropriate precomputed list up front - no per-request
+    # field projection for either tier
+    source = SAMPLE_HOTELS if current_user else PUBLIC_HOTELS
+
     if location:
-        hotels = [h for h in hotels if location.lower() in h["location"].lower()]
-    
-    # If user is not authenticated, remove sensitive information
-    if not current_user:
-        for hotel in hotels:
-            hotel.pop("available", None)  # Remove availability for non-authenticated users
-            
+        location_lower = location.lower()
+        matched = [h for h in source if location_lower in h["location"].lower()]
+    else:
+        matched = source
+
+    # Short-circuit unknown locations (a common scraper pattern) before any
+    # slicing work
+    if not matched:
+        return {
+            "hotels": [],
+            "total": 0,
+            "authenticated": current_user is not None
+        }
+
+    hotels = matched[skip : skip + limit]
+
     return {
         "hotels": hotels,
-        "total": len(SAMPLE_HOTELS),
+        "total": len(matched),
         "authenticated": current_user is not None
     }
 
@@ -82,23 +138,20 @@ async def get_hotel(
     """
     Get hotel details by ID. (Public endpoint with optional authentication)
     """
-    hotel = next((h for h in SAMPLE_HOTELS if h["id"] == hotel_id), None)
+    hotel = HOTELS_BY_ID.get(hotel_id)
     if not hotel:
         raise HTTPException(status_code=404, detail="Hotel not found")
-    
+
     # Authenticated users get full details
     if current_user:
         return {
             "hotel": hotel,
             "user_authenticated": True,
-            "special_offers": ["10% discount for verified users", "Free breakfast"]
+            "special_offers": SPECIAL_OFFERS
         }
     else:
-        # Remove sensitive information for non-authenticated users
-        public_hotel = hotel.copy()
-        public_hotel.pop("available", None)
         return {
-            "hotel": public_hotel,
+            "hotel": PUBLIC_HOTELS_BY_ID[hotel_id],
             "user_authenticated": False,
             "message": "Login for exclusive offers and availability"
         }
@@ -113,7 +166,7 @@ async def book_hotel(
     """
     Book a hotel. (Requires verified user authentication)
     """
-    hotel = next((h for h in SAMPLE_HOTELS if h["id"] == hotel_id), None)
+    hotel = HOTELS_BY_ID.get(hotel_id)
     if not hotel:
         raise HTTPException(status_code=404, detail="Hotel not found")
     
@@ -145,31 +198,13 @@ async def get_hotel_reviews(
     """
     Get hotel reviews. (Requires authentication)
     """
-    hotel = next((h for h in SAMPLE_HOTELS if h["id"] == hotel_id), None)
+    hotel = HOTELS_BY_ID.get(hotel_id)
     if not hotel:
         raise HTTPException(status_code=404, detail="Hotel not found")
     
-    # Sample reviews (in production, fetch from database)
-    reviews = [
-        {
-            "id": 1,
-            "user": "John D.",
-            "rating": 5,
-            "comment": "Absolutely fantastic stay! Will definitely come back.",
-            "date": "2024-01-15"
-        },
-        {
-            "id": 2,
-            "user": "Sarah M.",
-            "rating": 4,
-            "comment": "Great location and service. Room could be bigger.",
-            "date": "2024-01-10"
-        }
-    ]
-    
     return {
         "hotel_name": hotel["name"],
-        "reviews": reviews,
+        "reviews": SAMPLE_REVIEWS,
         "average_rating": hotel["rating"]
     }
 
@@ -183,7 +218,7 @@ async def create_hotel_review(
     """
     Create a hotel review. (Requires verified user authentication)
     """
-    hotel = next((h for h in SAMPLE_HOTELS if h["id"] == hotel_id), None)
+    hotel = HOTELS_BY_ID.get(hotel_id)
     if not hotel:
         raise HTTPException(status_code=404, detail="Hotel not found")
     
@@ -242,11 +277,7 @@ async def get_admin_statistics(
         "total_bookings": 1247,
         "revenue_this_month": 156750.50,
         "active_users": await User.all().count(),  # Count active users
-        "popular_destinations": [
-            {"location": "Bali, Indonesia", "bookings": 342},
-            {"location": "New York, USA", "bookings": 289},
-            {"location": "Swiss Alps, Switzerland", "bookings": 156}
-        ]
+        "popular_destinations": POPULAR_DESTINATIONS
     }
     
     return stats
\ No newline at end of file
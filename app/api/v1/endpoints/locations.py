@@ -43,17 +43,14 @@ def process_api_results(results) -> list:
     Process the API search results and format them
     """
     processed_results = []
-    
+
     for result in results:
-        # Remove travclanScore if present
-        clean_result = {k: v for k, v in result.items() if k != 'travclanScore'}
-        
         # For hotel type, use referenceId as the id if available
         result_id = result.get('id')
-        if (result.get('type', '').upper() == 'HOTEL' and 
-            result.get('referenceId') and result.get('referenceId') > 0):
-            result_id = result.get('referenceId')
-        
+        reference_id = result.get('referenceId')
+        if result.get('type', '').upper() == 'HOTEL' and reference_id and reference_id > 0:
+            result_id = reference_id
+
         processed_result = {
             'id': result_id,
             'type': result.get('type'),
@@ -1,12 +1,18 @@
+import asyncio
+import logging
 from datetime import datetime, date, timedelta
 from typing import List, Optional, Any, Dict
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from pydantic import BaseModel, Field
-import random
 
-from app.models.models import UniversalPriceHistory
+from tortoise.expressions import Q
+
+from app.core.cache import get_cached_json, set_cached_json
+from app.models.models import HotelPriceDailyLatest, UniversalPriceHistory
 from app.schemas.response import ResponseBase
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/recommendations", tags=["Recommendations"])
 
 
@@ -81,6 +87,37 @@ def generate_time_segments(start_date: date, variations: int) -> List[str]:
     return segments
 
 
+def _build_hotel_card(
+    hotel_data: Dict[str, Any],
+    price_format,
+    variation_status: Optional[tuple] = None
+) -> Hotel:
+    """Build a response Hotel card from a raw hotel record"""
+    price = hotel_data["price"]
+    if variation_status is None:
+        # Variation 0 is the only case where status depends on the price
+        variation_status = get_status_for_price(price, 0)
+    status, status_color, is_blurred, blur_msg = variation_status
+
+    return Hotel(
+        name=hotel_data["name"],
+        image=hotel_data["image"],
+        price=price_format(price),
+        status=status,
+        statusColor=status_color,
+        isBlurred=is_blurred,
+        blurMessage=blur_msg
+    )
+
+
+# Status presentation for the alternative variations is price-independent,
+# so it can be looked up once per variation instead of re-derived per hotel
+_VARIATION_STATUS = {
+    1: ("Premium View", "text-orange-600", True, "Upgrade to Premium to see exclusive rates"),
+    2: ("Peak Season", "text-red-600", True, "Subscribe to unlock holiday pricing"),
+}
+
+
 def get_status_for_price(price: float, variation_index: int) -> tuple[str, str, bool, Optional[str]]:
     """Generate status, color, blur state based on price and variation"""
     if variation_index == 0:
@@ -90,10 +127,255 @@ def get_status_for_price(price: float, variation_index: int) -> tuple[str, str,
             return "Limited", "text-orange-600", False, None
         else:
             return "Premium", "text-red-600", False, None
-    elif variation_index == 1:
-        return "Premium View", "text-orange-600", True, "Upgrade to Premium to see exclusive rates"
+    return _VARIATION_STATUS.get(variation_index, _VARIATION_STATUS[2])
+
+
+# Rows kept per (pattern, check-in) pair - enough for a card list after
+# name-deduplication, and the cap every price query carries in SQL
+_MAX_ROWS_PER_PAIR = 8
+
+
+async def _fetch_latest_price_rows(model, pairs: List[tuple]) -> List[Dict[str, Any]]:
+    """Fetch rollup price rows for every (pattern, check-in) pair in one query"""
+    # The pattern matches against property_name - a real CharField in the
+    # rollup's unique key. search_criteria is a JSONField and Tortoise has
+    # no icontains lookup for it (FieldError, on every backend)
+    query = Q()
+    for pattern, check_in in pairs:
+        query |= Q(price_date=check_in, property_name__icontains=pattern)
+
+    # .values() skips full model hydration - the card builder only needs
+    # these fields, not ORM instances. No LIMIT here: a global cap across
+    # OR'd pairs could starve one pair behind another's cheap rows, and
+    # the rollup table this serves holds at most one row per (property,
+    # date) so each pair is already bounded by the destination's property
+    # count
+    return await model.filter(
+        query, trackable_type="hotel_room"
+    ).order_by("price").values(
+        "property_name", "price", "currency", "search_criteria", "price_date"
+    )
+
+
+# History fallback scan bounds: rows come back in pages of this size and
+# the scan gives up at the cap, so one date with thousands of revisions
+# can't be slurped wholesale into memory
+_FALLBACK_SCAN_BATCH = 200
+_FALLBACK_SCAN_CAP = 1000
+
+
+async def _fetch_history_fallback_rows(pairs: List[tuple]) -> Dict[tuple, List[Dict[str, Any]]]:
+    """Fetch fallback price rows from the full history for missing pairs.
+
+    Unlike the rollup, history has no property_name column, so the
+    destination pattern cannot go into SQL (search_criteria is a
+    JSONField - Tortoise has no icontains lookup for it). Each check-in
+    date instead gets one price-ordered scan over the indexed
+    (trackable_type, price_date) predicate, paged with offset/limit and
+    matched against search_criteria in Python. The scan stops as soon as
+    every pattern on the date has its rows, or at the cap.
+    """
+    patterns_by_date: Dict[date, List[str]] = {}
+    for pattern, check_in in pairs:
+        patterns_by_date.setdefault(check_in, []).append(pattern)
+
+    results: Dict[tuple, List[Dict[str, Any]]] = {pair: [] for pair in pairs}
+
+    async def scan_date(check_in: date, patterns: List[str]) -> None:
+        offset = 0
+        while offset < _FALLBACK_SCAN_CAP:
+            page = await UniversalPriceHistory.filter(
+                trackable_type="hotel_room", price_date=check_in
+            ).order_by("price").offset(offset).limit(_FALLBACK_SCAN_BATCH).values(
+                "price", "currency", "search_criteria", "price_date"
+            )
+            for row in page:
+                criteria_text = str(row["search_criteria"]).lower()
+                for pattern in patterns:
+                    bucket = results[(pattern, check_in)]
+                    if len(bucket) < _MAX_ROWS_PER_PAIR and pattern in criteria_text:
+                        bucket.append(row)
+            if len(page) < _FALLBACK_SCAN_BATCH or all(
+                len(results[(pattern, check_in)]) >= _MAX_ROWS_PER_PAIR
+                for pattern in patterns
+            ):
+                break
+            offset += _FALLBACK_SCAN_BATCH
+
+    await asyncio.gather(*(
+        scan_date(check_in, patterns)
+        for check_in, patterns in patterns_by_date.items()
+    ))
+    return results
+
+
+def _bucket_price_rows(rows: List[Dict[str, Any]], buckets: Dict[tuple, List[Dict[str, Any]]]) -> None:
+    """Demultiplex batched rollup rows into per-(pattern, check-in) buckets"""
+    for row in rows:
+        property_name = row["property_name"].lower()
+        row_date = row["price_date"]
+        for pattern, check_in in buckets:
+            if row_date == check_in and pattern in property_name:
+                buckets[(pattern, check_in)].append(row)
+
+
+# Map destination IDs to query patterns - shared read-only across requests
+_DEST_PATTERNS = {
+    "ubud": "ubud",
+    "canggu": "canggu",
+    "seminyak": "seminyak",
+    "kuta": "kuta",
+    "sanur": "sanur",
+    "goa": "goa",
+    "mumbai": "mumbai",
+    "delhi": "delhi"
+}
+
+
+# Canned fallback data for destinations without price history. Fixed prices
+# keyed off the destination keep the degenerate path deterministic and off
+# the shared RNG (random.randint grabs a global lock under threadpools)
+_MOCK_IMAGE = "https://images.unsplash.com/photo-1571896349842-33c89424de2d?q=80&w=200&h=100&fit=crop"
+_MOCK_PRICES = (189, 249, 319, 379, 429, 479)
+
+
+def _rows_to_hotels(price_records: List[Dict[str, Any]], destination_id: str, currency: str) -> List[Dict[str, Any]]:
+    """Turn price rows into hotel dicts, deduping and topping up with mocks"""
+    # Keyed by name so dedupe and insertion are one dict operation; rows
+    # arrive price-ordered, so the first (cheapest) entry per name wins
+    hotels_by_name: Dict[str, Dict[str, Any]] = {}
+
+    for record in price_records:
+        search_criteria = record["search_criteria"] or {}
+        # Rollup rows carry the name as a real column; history rows only
+        # have it inside the search_criteria blob
+        hotel_name = record.get("property_name") or search_criteria.get(
+            "property_name", f"Hotel in {destination_id.title()}"
+        )
+
+        if hotel_name in hotels_by_name:
+            continue
+
+        hotels_by_name[hotel_name] = {
+            "name": hotel_name,
+            "image": search_criteria.get("main_image") or _MOCK_IMAGE,
+            "price": float(record["price"]),
+            "rating": search_criteria.get("overall_rating", 4.5),
+            "reviews": search_criteria.get("reviews", 1234),
+            "currency": record["currency"]
+        }
+
+    hotels = list(hotels_by_name.values())
+
+    # If we don't have enough data, fill with mock data - prices come from
+    # the canned table, offset by the destination so different cities don't
+    # all show identical numbers
+    price_offset = len(destination_id)
+    while len(hotels) < 3:
+        slot = len(hotels)
+        hotels.append({
+            "name": f"Premium Hotel {destination_id.title()} {slot + 1}",
+            "image": _MOCK_IMAGE,
+            "price": _MOCK_PRICES[(price_offset + slot) % len(_MOCK_PRICES)],
+            "rating": 4.5,
+            "reviews": 1234,
+            "currency": currency
+        })
+
+    return hotels[:6]  # Return top 6
+
+
+async def get_hotels_batch(
+    jobs: List[tuple],
+    adults: int,
+    children: int,
+    currency: str,
+    country_code: str
+) -> List[List[Dict[str, Any]]]:
+    """
+    Resolve hotels for a list of (destination_id, check_in, check_out) jobs.
+
+    All jobs share a single OR-batched query instead of one query per
+    (destination, date) pair, so a 3-variation x 3-destination request
+    costs one round-trip rather than nine. Results come back in job order.
+    """
+
+    # Collapse repeated (pattern, check-in) pairs - the same destination and
+    # date showing up across variations only needs one predicate
+    pair_for_job = []
+    buckets: Dict[tuple, List[Dict[str, Any]]] = {}
+    for destination_id, check_in, _check_out in jobs:
+        pattern = _DEST_PATTERNS.get(destination_id.lower(), destination_id.lower())
+        pair = (pattern, check_in)
+        pair_for_job.append((destination_id, pair))
+        buckets.setdefault(pair, [])
+
+    # Serve per-(destination, date) buckets from Redis when fresh - prices
+    # only move when a tracker run lands, so repeat recommendation calls
+    # within the TTL skip the database entirely
+    unique_pairs = list(buckets)
+    cache_keys = {
+        pair: f"recs:{pair[0]}:{pair[1].isoformat()}"
+        for pair in unique_pairs
+    }
+    if len(unique_pairs) == 1:
+        # Single-pair requests (one variation, one destination) skip the
+        # gather scheduling overhead entirely
+        cached_rows = [await get_cached_json(cache_keys[unique_pairs[0]])]
     else:
-        return "Peak Season", "text-red-600", True, "Subscribe to unlock holiday pricing"
+        cached_rows = await asyncio.gather(
+            *(get_cached_json(cache_keys[pair]) for pair in unique_pairs)
+        )
+
+    fresh_pairs = []
+    for pair, rows in zip(unique_pairs, cached_rows):
+        if rows is not None:
+            buckets[pair] = rows
+        else:
+            fresh_pairs.append(pair)
+
+    if fresh_pairs:
+        try:
+            # Prefer the daily rollup table - it already holds exactly one
+            # row per (property, date) with the latest recorded price, so we
+            # avoid scanning every historical revision in
+            # UniversalPriceHistory
+            fresh_buckets = {pair: buckets[pair] for pair in fresh_pairs}
+            rows = await _fetch_latest_price_rows(HotelPriceDailyLatest, fresh_pairs)
+            _bucket_price_rows(rows, fresh_buckets)
+
+            # Fall back to the full history for pairs recorded before the
+            # rollup existed. Missing pairs are rare (pre-rollup data
+            # only), and each date costs a bounded paged scan - see
+            # _fetch_history_fallback_rows for why the pattern match
+            # happens in Python there
+            missing_pairs = [pair for pair, bucket in fresh_buckets.items() if not bucket]
+            if missing_pairs:
+                fallback_rows = await _fetch_history_fallback_rows(missing_pairs)
+                for pair, rows in fallback_rows.items():
+                    fresh_buckets[pair].extend(rows)
+
+            # Only queried pairs get cached - a failed query must not pin
+            # empty buckets (and therefore mock hotels) for the whole TTL
+            if len(fresh_pairs) == 1:
+                pair = fresh_pairs[0]
+                await set_cached_json(cache_keys[pair], buckets[pair][:_MAX_ROWS_PER_PAIR], ttl_seconds=300)
+            else:
+                await asyncio.gather(
+                    *(set_cached_json(cache_keys[pair], buckets[pair][:_MAX_ROWS_PER_PAIR], ttl_seconds=300)
+                      for pair in fresh_pairs)
+                )
+        except Exception as e:
+            # Leave the buckets empty - _rows_to_hotels fills each
+            # destination with mock data when the database query fails.
+            # Log it, though: a silently broken query would make every
+            # response look like a destination with no price history
+            logger.error(f"Price lookup failed for {fresh_pairs}: {e}")
+
+    return [
+        _rows_to_hotels(buckets[pair][:_MAX_ROWS_PER_PAIR], destination_id, currency)
+        for destination_id, pair in pair_for_job
+    ]
 
 
 async def get_hotels_from_database(
@@ -106,75 +388,10 @@ async def get_hotels_from_database(
     country_code: str
 ) -> List[Dict[str, Any]]:
     """Get hotels from internal price history database"""
-
-    # Map destination IDs to query patterns
-    destination_patterns = {
-        "ubud": "ubud",
-        "canggu": "canggu",
-        "seminyak": "seminyak",
-        "kuta": "kuta",
-        "sanur": "sanur",
-        "goa": "goa",
-        "mumbai": "mumbai",
-        "delhi": "delhi"
-    }
-
-    location_pattern = destination_patterns.get(destination_id.lower(), destination_id.lower())
-
-    try:
-        # Query our price history database
-        price_records = await UniversalPriceHistory.filter(
-            trackable_type="hotel_room",
-            price_date=check_in,
-            search_criteria__icontains=location_pattern
-        ).order_by("price").limit(8)
-
-        hotels = []
-        seen_hotels = set()  # Track unique hotels by name
-
-        for record in price_records:
-            search_criteria = record.search_criteria or {}
-            hotel_name = search_criteria.get("property_name", f"Hotel in {destination_id.title()}")
-
-            # Skip duplicates
-            if hotel_name in seen_hotels:
-                continue
-            seen_hotels.add(hotel_name)
-
-            hotels.append({
-                "name": hotel_name,
-                "image": search_criteria.get("main_image") or "https://images.unsplash.com/photo-1571896349842-33c89424de2d?q=80&w=200&h=100&fit=crop",
-                "price": float(record.price),
-                "rating": search_criteria.get("overall_rating", 4.5),
-                "reviews": search_criteria.get("reviews", 1234),
-                "currency": record.currency
-            })
-
-        # If we don't have enough data, fill with mock data
-        while len(hotels) < 3:
-            hotels.append({
-                "name": f"Premium Hotel {destination_id.title()} {len(hotels) + 1}",
-                "image": "https://images.unsplash.com/photo-1571896349842-33c89424de2d?q=80&w=200&h=100&fit=crop",
-                "price": random.randint(150, 500),
-                "rating": 4.5,
-                "reviews": 1234,
-                "currency": currency
-            })
-
-        return hotels[:6]  # Return top 6
-
-    except Exception as e:
-        # Return mock data if database query fails
-        return [
-            {
-                "name": f"Premium Hotel {destination_id.title()}",
-                "image": "https://images.unsplash.com/photo-1571896349842-33c89424de2d?q=80&w=200&h=100&fit=crop",
-                "price": random.randint(150, 500),
-                "rating": 4.5,
-                "reviews": 1234,
-                "currency": currency
-            }
-        ]
+    results = await get_hotels_batch(
+        [(destination_id, check_in, check_out)], adults, children, currency, country_code
+    )
+    return results[0]
 
 
 @router.post("/multi-destination", response_model=ResponseBase[RecommendationResponse])
@@ -191,41 +408,59 @@ async def get_multi_destination_recommendations(
         total_nights = sum(dest.nights for dest in request.destinations)
         trip_month = request.start_date.strftime("%B")
 
-        time_segments = []
+        # Precompute the date ranges for every variation, then resolve all
+        # (variation, destination) hotel lookups through one batched query -
+        # the database sees a single round-trip instead of
+        # variations x destinations
+        variation_date_ranges = [
+            calculate_date_ranges(
+                request.destinations,
+                request.start_date + timedelta(days=variation_idx * 7)
+            )
+            for variation_idx in range(request.variations)
+        ]
 
-        # Process each variation (different start dates)
-        for variation_idx in range(request.variations):
-            variation_start_date = request.start_date + timedelta(days=variation_idx * 7)
-            date_ranges = calculate_date_ranges(request.destinations, variation_start_date)
+        hotel_lookups = await get_hotels_batch(
+            [
+                (dest_id, check_in, check_out)
+                for date_ranges in variation_date_ranges
+                for dest_id, check_in, check_out in date_ranges
+            ],
+            request.adults, request.children,
+            request.currency, request.country_code
+        )
+
+        # Price formatting does not depend on the hotel - pick the format
+        # callable once per request
+        if request.currency == "USD":
+            price_format = "${}/night".format
+        else:
+            price_format = ("{} " + request.currency + "/night").format
+
+        # Assemble the response from the batched results (same order as
+        # the jobs were listed)
+        lookup_results = iter(hotel_lookups)
+        time_segments = []
 
+        for variation_idx, date_ranges in enumerate(variation_date_ranges):
+            # Status is fixed for non-zero variations - resolve it once here
+            # rather than per hotel card
+            variation_status = (
+                None if variation_idx == 0
+                else get_status_for_price(0.0, variation_idx)
+            )
             # Create destinations for this time segment
             segment_destinations = []
 
-            # For each destination in this variation
             for dest_id, check_in, check_out in date_ranges:
-                # Get hotels from internal database
-                hotels_data = await get_hotels_from_database(
-                    dest_id, check_in, check_out,
-                    request.adults, request.children,
-                    request.currency, request.country_code
-                )
+                hotels_data = next(lookup_results)
 
                 # Create hotels for this destination in this time segment
-                hotels = []
-                for hotel_data in hotels_data[:2]:  # Top 2 hotels per destination per variation
-                    price = hotel_data["price"]
-                    status, status_color, is_blurred, blur_msg = get_status_for_price(price, variation_idx)
-
-                    hotel = Hotel(
-                        name=hotel_data["name"],
-                        image=hotel_data["image"],
-                        price=f"${price}/night" if request.currency == "USD" else f"{price} {request.currency}/night",
-                        status=status,
-                        statusColor=status_color,
-                        isBlurred=is_blurred,
-                        blurMessage=blur_msg
-                    )
-                    hotels.append(hotel)
+                # (top 2 hotels per destination per variation)
+                hotels = [
+                    _build_hotel_card(hotel_data, price_format, variation_status)
+                    for hotel_data in hotels_data[:2]
+                ]
 
                 # Create destination with its hotels
                 destination = Destination(name=dest_id.title(), hotels=hotels)
@@ -255,22 +490,30 @@ async def get_multi_destination_recommendations(
         raise HTTPException(status_code=500, detail=f"Failed to generate recommendations: {str(e)}")
 
 
-@router.get("/destinations", response_model=ResponseBase[List[Dict[str, str]]])
+# The destination catalogue is static config, so the full response body is
+# serialized once at import - the endpoint just ships the bytes back out
+# with no per-request allocation or validation
+_DESTINATIONS = [
+    {"id": "ubud", "name": "Ubud, Bali", "country": "Indonesia"},
+    {"id": "canggu", "name": "Canggu, Bali", "country": "Indonesia"},
+    {"id": "seminyak", "name": "Seminyak, Bali", "country": "Indonesia"},
+    {"id": "kuta", "name": "Kuta, Bali", "country": "Indonesia"},
+    {"id": "sanur", "name": "Sanur, Bali", "country": "Indonesia"},
+    {"id": "goa", "name": "Goa", "country": "India"},
+    {"id": "mumbai", "name": "Mumbai", "country": "India"},
+    {"id": "delhi", "name": "Delhi", "country": "India"}
+]
+
+# Built through ResponseBase so the wire shape stays identical to the
+# other endpoints (including the errors field)
+_DESTINATIONS_RESPONSE = ResponseBase(
+    success=True,
+    message="Available destinations retrieved",
+    data=_DESTINATIONS
+).model_dump_json()
+
+
+@router.get("/destinations")
 async def get_available_destinations():
     """Get list of available destinations"""
-    destinations = [
-        {"id": "ubud", "name": "Ubud, Bali", "country": "Indonesia"},
-        {"id": "canggu", "name": "Canggu, Bali", "country": "Indonesia"},
-        {"id": "seminyak", "name": "Seminyak, Bali", "country": "Indonesia"},
-        {"id": "kuta", "name": "Kuta, Bali", "country": "Indonesia"},
-        {"id": "sanur", "name": "Sanur, Bali", "country": "Indonesia"},
-        {"id": "goa", "name": "Goa", "country": "India"},
-        {"id": "mumbai", "name": "Mumbai", "country": "India"},
-        {"id": "delhi", "name": "Delhi", "country": "India"}
-    ]
-
-    return ResponseBase(
-        success=True,
-        message="Available destinations retrieved",
-        data=destinations
-    )
\ No newline at end of file
+    return Response(content=_DESTINATIONS_RESPONSE, media_type="application/json")
\ No newline at end of file
@@ -1,8 +1,20 @@
-from datetime import datetime, date
+import asyncio
+from datetime import datetime, date, timezone
 from typing import List, Optional, Any, Dict
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from pydantic import BaseModel, Field
 
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from tortoise.functions import Count
+
+from app.core.cache import (
+    bump_namespace_version,
+    get_cached_bytes,
+    get_namespace_version,
+    make_cache_key,
+    set_cached_bytes,
+)
 from app.models.models import Tracker, TrackerResult
 from app.services.tracking_service import HotelTrackingService, get_tracking_service
 from app.services.serp_service import SearchCriteria, SortBy, Rating, HotelClass
@@ -38,6 +50,7 @@ class TrackerResponse(BaseModel):
     last_run_at: Optional[datetime]
     created_at: datetime
     search_parameters: Optional[Dict[str, Any]]
+    result_count: int = 0
 
 
 class TrackerResultResponse(BaseModel):
@@ -50,6 +63,9 @@ class TrackerResultResponse(BaseModel):
     error_message: Optional[str]
     created_at: datetime
 
+    class Config:
+        from_attributes = True
+
 
 class RunTrackerRequest(BaseModel):
     tracker_ids: List[int] = Field(..., description="List of tracker IDs to run")
@@ -66,23 +82,103 @@ class TestSearchRequest(BaseModel):
     language: str = Field("en", description="Language code")
 
 
-@router.post("/trackers", response_model=ResponseBase[TrackerResponse])
+# Built once at import - constructing the serializer for a response schema
+# is not free, and FastAPI would otherwise pay an equivalent cost per
+# request on the response_model path
+_RESULT_LIST_ADAPTER = TypeAdapter(ResponseBase[List[TrackerResultResponse]])
+_TRACKER_ADAPTER = TypeAdapter(ResponseBase[TrackerResponse])
+
+
+def _tracker_envelope_response(message: str, tracker: Tracker) -> Response:
+    """Serialize a single-tracker envelope straight to JSON bytes.
+
+    Skips FastAPI's response_model path, which would jsonable_encode and
+    re-validate data the ORM already guarantees; the adapter walks the
+    attributes once and emits bytes directly.
+    """
+    envelope = ResponseBase[TrackerResponse].model_construct(
+        success=True,
+        message=message,
+        data=_tracker_response(tracker),
+        errors=None,
+    )
+    return Response(
+        content=_TRACKER_ADAPTER.dump_json(envelope),
+        media_type="application/json",
+    )
+
+
+def _result_list_response(message: str, results) -> Response:
+    """Serialize a tracker-result list envelope straight to bytes"""
+    envelope = ResponseBase[List[TrackerResultResponse]].model_construct(
+        success=True,
+        message=message,
+        data=[_tracker_result_response(result) for result in results],
+        errors=None,
+    )
+    return Response(
+        content=_RESULT_LIST_ADAPTER.dump_json(envelope),
+        media_type="application/json",
+    )
+
+
+def _tracker_response(tracker: Tracker) -> TrackerResponse:
+    """Build a TrackerResponse from a tracker row.
+
+    model_construct skips field validation - these values come straight
+    from the ORM, whose column types already guarantee the invariants, so
+    re-validating them per row is pure overhead.
+    """
+    return TrackerResponse.model_construct(
+        id=tracker.id,
+        name=tracker.name,
+        description=tracker.description,
+        status=tracker.status,
+        tracker_type=tracker.tracker_type,
+        total_runs=tracker.total_runs,
+        successful_runs=tracker.successful_runs,
+        last_run_at=tracker.last_run_at,
+        created_at=tracker.created_at,
+        search_parameters=tracker.search_criteria
+    )
+
+
+def _tracker_result_response(result: TrackerResult) -> TrackerResultResponse:
+    """Build a TrackerResultResponse from a result row without validation"""
+    return TrackerResultResponse.model_construct(
+        id=result.id,
+        tracker_id=result.tracker_id,
+        run_id=result.run_id,
+        success=result.success,
+        items_found=result.items_found,
+        execution_time_seconds=result.execution_time_seconds,
+        error_message=result.error_message,
+        created_at=result.created_at
+    )
+
+
+def _search_parameters(request: CreateTrackerRequest) -> Dict[str, Any]:
+    """Build the stored search-parameter dict from a tracker request"""
+    return {
+        "query": request.query,
+        "start_date": request.start_date.isoformat(),
+        "end_date": request.end_date.isoformat(),
+        "interval_days": request.interval_days,
+        "stay_duration_days": request.stay_duration_days,
+        "adults": request.adults,
+        "children": request.children,
+        "currency": request.currency,
+        "country_code": request.country_code,
+        "language": request.language,
+    }
+
+
+@router.post("/trackers", responses={200: {"model": ResponseBase[TrackerResponse]}})
 async def create_tracker(request: CreateTrackerRequest):
     """Create a new hotel price tracker"""
     try:
         # Prepare search parameters
-        search_parameters = {
-            "query": request.query,
-            "start_date": request.start_date.isoformat(),
-            "end_date": request.end_date.isoformat(),
-            "interval_days": request.interval_days,
-            "stay_duration_days": request.stay_duration_days,
-            "adults": request.adults,
-            "children": request.children,
-            "currency": request.currency,
-            "country_code": request.country_code,
-            "language": request.language,
-        }
+        search_parameters = _search_parameters(request)
 
         # Create tracker with required fields
         tracker = await Tracker.create(
@@ -97,30 +193,19 @@ async def create_tracker(request: CreateTrackerRequest):
             user_id=1,  # Default user for now - in production use authenticated user
         )
 
-        response_data = TrackerResponse(
-            id=tracker.id,
-            name=tracker.name,
-            description=tracker.description,
-            status=tracker.status,
-            tracker_type=tracker.tracker_type,
-            total_runs=tracker.total_runs,
-            successful_runs=tracker.successful_runs,
-            last_run_at=tracker.last_run_at,
-            created_at=tracker.created_at,
-            search_parameters=tracker.search_criteria
-        )
+        # Invalidate cached tracker lists
+        await bump_namespace_version("trackers")
 
-        return ResponseBase(
-            success=True,
-            message="Tracker created successfully",
-            data=response_data
-        )
+        return _tracker_envelope_response("Tracker created successfully", tracker)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create tracker: {str(e)}")
 
 
-@router.get("/trackers", response_model=ResponseBase[List[TrackerResponse]])
+# The hot list endpoints skip response_model: FastAPI would re-validate and
+# jsonable_encode every row a second time on data the ORM already
+# guarantees. The schema is still advertised via the responses= declaration
+@router.get("/trackers", responses={200: {"model": ResponseBase[List[TrackerResponse]]}})
 async def list_trackers(
     status: Optional[str] = None,
     tracker_type: Optional[str] = None,
@@ -129,6 +214,18 @@ async def list_trackers(
 ):
     """List all trackers"""
     try:
+        # Tracker lists only change on mutations, so the serialized body is
+        # cached in Redis. The namespace version is baked into the key;
+        # create/update/delete bump it, instantly invalidating every page
+        version = await get_namespace_version("trackers")
+        cache_key = make_cache_key(
+            f"trackers:{version}:list",
+            {"status": status, "tracker_type": tracker_type, "limit": limit, "offset": offset},
+        )
+        cached_body = await get_cached_bytes(cache_key)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json")
+
         query = Tracker.all()
 
         if status:
@@ -137,111 +234,140 @@ async def list_trackers(
         if tracker_type:
             query = query.filter(tracker_type=tracker_type)
 
-        trackers = await query.offset(offset).limit(limit).all()
-
-        response_data = [
-            TrackerResponse(
-                id=tracker.id,
-                name=tracker.name,
-                description=tracker.description,
-                status=tracker.status,
-                tracker_type=tracker.tracker_type,
-                total_runs=tracker.total_runs,
-                successful_runs=tracker.successful_runs,
-                last_run_at=tracker.last_run_at,
-                created_at=tracker.created_at,
-                search_parameters=tracker.search_criteria
-            )
-            for tracker in trackers
-        ]
-
-        return ResponseBase(
-            success=True,
-            message=f"Retrieved {len(response_data)} trackers",
-            data=response_data
+        # Trackers carry several wide JSON columns (trackable_items,
+        # filters, preferences, ...) that the list response never reads -
+        # .values() keeps them out of the result set and skips ORM model
+        # instantiation entirely; the dicts go straight into the body
+        response_data = await query.offset(offset).limit(limit).values(
+            "id", "name", "description", "status", "tracker_type",
+            "total_runs", "successful_runs", "last_run_at", "created_at",
+            "search_criteria"
         )
+        # Stored result counts per tracker come from one GROUP BY query
+        # rather than a count() round-trip per row - the denormalized
+        # total_runs counter can drift, this is the ground truth
+        result_counts = {
+            row["tracker_id"]: row["cnt"]
+            for row in await TrackerResult.filter(
+                tracker_id__in=[row["id"] for row in response_data]
+            ).annotate(cnt=Count("id")).group_by("tracker_id").values("tracker_id", "cnt")
+        }
+
+        for row in response_data:
+            row["search_parameters"] = row.pop("search_criteria")
+            row["result_count"] = result_counts.get(row["id"], 0)
+
+        body = orjson.dumps({
+            "success": True,
+            "message": f"Retrieved {len(response_data)} trackers",
+            "data": response_data,
+            "errors": None
+        })
+        await set_cached_bytes(cache_key, body, ttl_seconds=30)
+
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve trackers: {str(e)}")
 
 
-@router.get("/trackers/{tracker_id}", response_model=ResponseBase[TrackerResponse])
+@router.get("/trackers/stream")
+async def stream_trackers(
+    status: Optional[str] = None,
+    tracker_type: Optional[str] = None,
+    limit: int = 500,
+    offset: int = 0
+):
+    """Stream trackers as a JSON array without buffering the full list.
+
+    Scale variant of GET /trackers for large exports: rows are encoded and
+    written as they arrive from the database, so time-to-first-byte and
+    peak memory stay per-row instead of per-list.
+    """
+    query = Tracker.all()
+
+    if status:
+        query = query.filter(status=status)
+
+    if tracker_type:
+        query = query.filter(tracker_type=tracker_type)
+
+    query = query.offset(offset).limit(limit).only(
+        "id", "name", "description", "status", "tracker_type",
+        "total_runs", "successful_runs", "last_run_at", "created_at",
+        "search_criteria"
+    )
+
+    async def render():
+        yield b"["
+        first = True
+        async for tracker in query:
+            if first:
+                first = False
+            else:
+                yield b","
+            yield orjson.dumps(
+                {
+                    "id": tracker.id,
+                    "name": tracker.name,
+                    "description": tracker.description,
+                    "status": tracker.status,
+                    "tracker_type": tracker.tracker_type,
+                    "total_runs": tracker.total_runs,
+                    "successful_runs": tracker.successful_runs,
+                    "last_run_at": tracker.last_run_at,
+                    "created_at": tracker.created_at,
+                    "search_parameters": tracker.search_criteria,
+                },
+                default=str,
+            )
+        yield b"]"
+
+    return StreamingResponse(render(), media_type="application/json")
+
+
+@router.get("/trackers/{tracker_id}", responses={200: {"model": ResponseBase[TrackerResponse]}})
 async def get_tracker(tracker_id: int):
     """Get a specific tracker"""
     tracker = await Tracker.get_or_none(id=tracker_id)
     if not tracker:
         raise HTTPException(status_code=404, detail="Tracker not found")
 
-    response_data = TrackerResponse(
-        id=tracker.id,
-        name=tracker.name,
-        description=tracker.description,
-        status=tracker.status,
-        tracker_type=tracker.tracker_type,
-        total_runs=tracker.total_runs,
-        successful_runs=tracker.successful_runs,
-        last_run_at=tracker.last_run_at,
-        created_at=tracker.created_at,
-        search_parameters=tracker.search_criteria
-    )
-
-    return ResponseBase(
-        success=True,
-        message="Tracker retrieved successfully",
-        data=response_data
-    )
+    return _tracker_envelope_response("Tracker retrieved successfully", tracker)
 
 
-@router.put("/trackers/{tracker_id}", response_model=ResponseBase[TrackerResponse])
+@router.put("/trackers/{tracker_id}", responses={200: {"model": ResponseBase[TrackerResponse]}})
 async def update_tracker(tracker_id: int, request: CreateTrackerRequest):
     """Update an existing tracker"""
-    tracker = await Tracker.get_or_none(id=tracker_id)
-    if not tracker:
-        raise HTTPException(status_code=404, detail="Tracker not found")
-
     try:
         # Update search parameters
-        search_parameters = {
-            "query": request.query,
-            "start_date": request.start_date.isoformat(),
-            "end_date": request.end_date.isoformat(),
-            "interval_days": request.interval_days,
-            "stay_duration_days": request.stay_duration_days,
-            "adults": request.adults,
-            "children": request.children,
-            "currency": request.currency,
-            "country_code": request.country_code,
-            "language": request.language,
-        }
-
-        # Update tracker
-        tracker.name = request.name
-        tracker.description = request.description
-        tracker.search_criteria = search_parameters
-        tracker.is_scheduled = request.is_scheduled
-        tracker.updated_at = datetime.utcnow()
-
-        await tracker.save()
-
-        response_data = TrackerResponse(
-            id=tracker.id,
-            name=tracker.name,
-            description=tracker.description,
-            status=tracker.status,
-            tracker_type=tracker.tracker_type,
-            total_runs=tracker.total_runs,
-            successful_runs=tracker.successful_runs,
-            last_run_at=tracker.last_run_at,
-            created_at=tracker.created_at,
-            search_parameters=tracker.search_criteria
+        search_parameters = _search_parameters(request)
+
+        # Single UPDATE - the rowcount distinguishes missing trackers, so
+        # the 404 path costs one query and there is no SELECT-then-save race.
+        # filter().update() bypasses auto_now, hence the explicit stamp.
+        # request.is_scheduled is deliberately not written: Tracker has no
+        # such column, and update() rejects unknown kwargs
+        updated_count = await Tracker.filter(id=tracker_id).update(
+            name=request.name,
+            description=request.description,
+            search_criteria=search_parameters,
+            updated_at=datetime.now(timezone.utc),
         )
+        if not updated_count:
+            raise HTTPException(status_code=404, detail="Tracker not found")
 
-        return ResponseBase(
-            success=True,
-            message="Tracker updated successfully",
-            data=response_data
-        )
+        # One SELECT for the response body - the request alone doesn't carry
+        # the run counters and status the response includes
+        tracker = await Tracker.get(id=tracker_id)
+
+        # Invalidate cached tracker lists
+        await bump_namespace_version("trackers")
 
+        return _tracker_envelope_response("Tracker updated successfully", tracker)
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update tracker: {str(e)}")
 
@@ -249,23 +375,28 @@ async def update_tracker(tracker_id: int, request: CreateTrackerRequest):
 @router.delete("/trackers/{tracker_id}", response_model=ResponseBase[None])
 async def delete_tracker(tracker_id: int):
     """Delete a tracker"""
-    tracker = await Tracker.get_or_none(id=tracker_id)
-    if not tracker:
-        raise HTTPException(status_code=404, detail="Tracker not found")
-
     try:
-        await tracker.delete()
+        # Single DELETE - the rowcount distinguishes missing trackers
+        deleted_count = await Tracker.filter(id=tracker_id).delete()
+        if not deleted_count:
+            raise HTTPException(status_code=404, detail="Tracker not found")
+
+        # Invalidate cached tracker lists
+        await bump_namespace_version("trackers")
+
         return ResponseBase(
             success=True,
             message="Tracker deleted successfully",
             data=None
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete tracker: {str(e)}")
 
 
-@router.post("/run", response_model=ResponseBase[List[TrackerResultResponse]])
+@router.post("/run", responses={200: {"model": ResponseBase[List[TrackerResultResponse]]}})
 async def run_trackers(
     request: RunTrackerRequest,
     background_tasks: BackgroundTasks,
@@ -273,36 +404,22 @@ async def run_trackers(
 ):
     """Run specific trackers manually"""
     try:
-        # Validate tracker IDs
-        trackers = []
-        for tracker_id in request.tracker_ids:
-            tracker = await Tracker.get_or_none(id=tracker_id)
-            if not tracker:
-                raise HTTPException(status_code=404, detail=f"Tracker {tracker_id} not found")
-            trackers.append(tracker)
+        # Validate all tracker IDs with one query instead of a get_or_none
+        # round-trip per ID
+        found_ids = set(
+            await Tracker.filter(id__in=request.tracker_ids).values_list("id", flat=True)
+        )
+        missing_ids = [tid for tid in request.tracker_ids if tid not in found_ids]
+        if missing_ids:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Trackers not found: {', '.join(map(str, missing_ids))}"
+            )
 
         # Run trackers
         results = await tracking_service.run_multiple_trackers(request.tracker_ids)
 
-        response_data = [
-            TrackerResultResponse(
-                id=result.id,
-                tracker_id=result.tracker_id,
-                run_id=result.run_id,
-                success=result.success,
-                items_found=result.items_found,
-                execution_time_seconds=result.execution_time_seconds,
-                error_message=result.error_message,
-                created_at=result.created_at
-            )
-            for result in results
-        ]
-
-        return ResponseBase(
-            success=True,
-            message=f"Executed {len(results)} trackers",
-            data=response_data
-        )
+        return _result_list_response(f"Executed {len(results)} trackers", results)
 
     except HTTPException:
         raise
@@ -310,7 +427,7 @@ async def run_trackers(
         raise HTTPException(status_code=500, detail=f"Failed to run trackers: {str(e)}")
 
 
-@router.post("/run-scheduled", response_model=ResponseBase[List[TrackerResultResponse]])
+@router.post("/run-scheduled", responses={200: {"model": ResponseBase[List[TrackerResultResponse]]}})
 async def run_scheduled_trackers(
     background_tasks: BackgroundTasks,
     tracking_service: HotelTrackingService = Depends(get_tracking_service)
@@ -319,70 +436,89 @@ async def run_scheduled_trackers(
     try:
         results = await tracking_service.run_scheduled_trackers()
 
-        response_data = [
-            TrackerResultResponse(
-                id=result.id,
-                tracker_id=result.tracker_id,
-                run_id=result.run_id,
-                success=result.success,
-                items_found=result.items_found,
-                execution_time_seconds=result.execution_time_seconds,
-                error_message=result.error_message,
-                created_at=result.created_at
-            )
-            for result in results
-        ]
-
-        return ResponseBase(
-            success=True,
-            message=f"Executed {len(results)} scheduled trackers",
-            data=response_data
-        )
+        return _result_list_response(f"Executed {len(results)} scheduled trackers", results)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to run scheduled trackers: {str(e)}")
 
 
-@router.get("/trackers/{tracker_id}/results", response_model=ResponseBase[List[TrackerResultResponse]])
+@router.get("/trackers/{tracker_id}/results", responses={200: {"model": ResponseBase[List[TrackerResultResponse]]}})
 async def get_tracker_results(
     tracker_id: int,
     limit: int = 50,
     offset: int = 0
 ):
     """Get results for a specific tracker"""
-    tracker = await Tracker.get_or_none(id=tracker_id)
-    if not tracker:
-        raise HTTPException(status_code=404, detail="Tracker not found")
-
     try:
-        results = await TrackerResult.filter(
-            tracker_id=tracker_id
-        ).order_by('-created_at').offset(offset).limit(limit).all()
-
-        response_data = [
-            TrackerResultResponse(
-                id=result.id,
-                tracker_id=result.tracker_id,
-                run_id=result.run_id,
-                success=result.success,
-                items_found=result.items_found,
-                execution_time_seconds=result.execution_time_seconds,
-                error_message=result.error_message,
-                created_at=result.created_at
+        # The existence probe and the results page are independent, so run
+        # them concurrently - the 404 decision only needs the probe once
+        # both are back. The EXISTS query avoids hydrating the full tracker
+        # row just to reject a bad ID
+        # .values() projects away the wide JSON columns (results_data,
+        # insights, recommendations, ...) and returns dicts that feed the
+        # response body directly, with no ORM instances in between
+        tracker_exists, response_data = await asyncio.gather(
+            Tracker.exists(id=tracker_id),
+            TrackerResult.filter(
+                tracker_id=tracker_id
+            ).order_by('-created_at').offset(offset).limit(limit).values(
+                "id", "tracker_id", "run_id", "success", "items_found",
+                "execution_time_seconds", "error_message", "created_at"
             )
-            for result in results
-        ]
-
-        return ResponseBase(
-            success=True,
-            message=f"Retrieved {len(response_data)} results",
-            data=response_data
         )
 
+        if not tracker_exists:
+            raise HTTPException(status_code=404, detail="Tracker not found")
+
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Retrieved {len(response_data)} results",
+            "data": response_data,
+            "errors": None
+        })
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve results: {str(e)}")
 
 
+# Page size for the NDJSON export - big enough to amortize the query
+# round-trip, small enough that a page is trivial to hold in memory
+_RESULT_STREAM_BATCH = 500
+
+
+@router.get("/trackers/{tracker_id}/results/stream")
+async def stream_tracker_results(tracker_id: int):
+    """Stream a tracker's results as NDJSON without buffering the list.
+
+    Scale variant of GET /trackers/{id}/results for large exports. Rows
+    are pulled in fixed-size offset/limit pages - iterating a Tortoise
+    queryset materializes the whole result set first, so the paging is
+    what keeps peak memory per-page rather than per-tracker - and each
+    page is encoded and written out before the next is fetched.
+    """
+    if not await Tracker.exists(id=tracker_id):
+        raise HTTPException(status_code=404, detail="Tracker not found")
+
+    async def render():
+        offset = 0
+        while True:
+            page = await TrackerResult.filter(
+                tracker_id=tracker_id
+            ).order_by('-created_at').offset(offset).limit(_RESULT_STREAM_BATCH).values(
+                "id", "tracker_id", "run_id", "success", "items_found",
+                "execution_time_seconds", "error_message", "created_at"
+            )
+            for row in page:
+                yield orjson.dumps(row, default=str) + b"\n"
+            if len(page) < _RESULT_STREAM_BATCH:
+                break
+            offset += _RESULT_STREAM_BATCH
+
+    return StreamingResponse(render(), media_type="application/x-ndjson")
+
+
 @router.post("/test-search", response_model=ResponseBase[Dict[str, Any]])
 async def test_search(
     request: TestSearchRequest,
@@ -414,28 +550,43 @@ async def test_search(
         }
 
         if response.properties:
-            prices = [
-                prop.rate_per_night.extracted_lowest
-                for prop in response.properties
-                if prop.rate_per_night and prop.rate_per_night.extracted_lowest
-            ]
-            if prices:
+            # One pass over the properties: accumulate min/max/sum and
+            # collect the first 5 samples as we go, instead of building an
+            # intermediate price list and re-slicing the properties
+            price_min = price_max = None
+            price_sum = 0.0
+            price_count = 0
+            samples = []
+            for index, prop in enumerate(response.properties):
+                price = (
+                    prop.rate_per_night.extracted_lowest
+                    if prop.rate_per_night else None
+                )
+                if price:
+                    if price_min is None or price < price_min:
+                        price_min = price
+                    if price_max is None or price > price_max:
+                        price_max = price
+                    price_sum += price
+                    price_count += 1
+
+                if index < 5:
+                    samples.append({
+                        "name": prop.name,
+                        "type": prop.type,
+                        "price": price,
+                        "rating": prop.overall_rating,
+                        "reviews": prop.reviews
+                    })
+
+            if price_count:
                 summary["price_range"] = {
-                    "min": min(prices),
-                    "max": max(prices),
-                    "average": sum(prices) / len(prices)
+                    "min": price_min,
+                    "max": price_max,
+                    "average": price_sum / price_count
                 }
 
-            summary["sample_properties"] = [
-                {
-                    "name": prop.name,
-                    "type": prop.type,
-                    "price": prop.rate_per_night.extracted_lowest if prop.rate_per_night else None,
-                    "rating": prop.overall_rating,
-                    "reviews": prop.reviews
-                }
-                for prop in response.properties[:5]  # First 5 properties
-            ]
+            summary["sample_properties"] = samples
 
         return ResponseBase(
             success=True,
@@ -2,8 +2,10 @@ from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from app import crud, models, schemas
+from app import models, schemas
 from app.api.tortoise_deps import get_current_superuser, get_current_active_user
+from app.crud.tortoise_user import tortoise_user
+from app.models.models import RefreshToken, User
 
 router = APIRouter()
 
@@ -17,8 +19,7 @@ async def read_users(
     """
     Retrieve users. (Admin only)
     """
-    users = await crud.user.get_multi(db, skip=skip, limit=limit)
-    return users
+    return await User.all().offset(skip).limit(limit)
 
 
 @router.post("/", response_model=schemas.UserResponse)
@@ -30,13 +31,17 @@ async def create_user(
     """
     Create new user. (Admin only)
     """
-    user = await crud.user.get_by_email(db, email=user_in.email)
-    if user:
+    existing_user = await User.get_or_none(email=user_in.email)
+    if existing_user:
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system.",
         )
-    user = await crud.user.create(db, obj_in=user_in)
+    user = await tortoise_user.create(
+        email=user_in.email,
+        password=user_in.password,
+        full_name=user_in.full_name,
+    )
     return user
 
 
@@ -50,13 +55,21 @@ async def update_user(
     """
     Update a user. (Admin only)
     """
-    user = await crud.user.get(db, id=user_id)
+    user = await User.get_or_none(id=user_id)
     if not user:
         raise HTTPException(
             status_code=404,
             detail="The user with this username does not exist in the system",
         )
-    user = await crud.user.update(db, db_obj=user, obj_in=user_in)
+    # Only apply keys that are real model columns - update_from_dict raises
+    # on unknown names, and the schema should never 500 a valid body
+    update_data = {
+        k: v for k, v in user_in.model_dump(exclude_unset=True).items()
+        if k in User._meta.db_fields
+    }
+    if update_data:
+        user.update_from_dict(update_data)
+        await user.save(update_fields=list(update_data))
     return user
 
 
@@ -68,10 +81,12 @@ async def read_user_by_id(
     """
     Get a specific user by id.
     """
-    user = await crud.user.get(db, id=user_id)
+    user = await User.get_or_none(id=user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
     if user == current_user:
         return user
-    if not await crud.user.is_superuser(current_user):
+    if not current_user.is_superuser:
         raise HTTPException(
             status_code=400, detail="The user doesn't have enough privileges"
         )
@@ -87,17 +102,16 @@ async def delete_user(
     """
     Delete a user. (Admin only)
     """
-    user = await crud.user.get(db, id=user_id)
-    if not user:
+    if user_id == current_user.id:
         raise HTTPException(
-            status_code=404,
-            detail="The user with this username does not exist in the system",
+            status_code=400, detail="Users cannot delete themselves"
         )
-    if user == current_user:
+    deleted_count = await User.filter(id=user_id).delete()
+    if not deleted_count:
         raise HTTPException(
-            status_code=400, detail="Users cannot delete themselves"
+            status_code=404,
+            detail="The user with this username does not exist in the system",
         )
-    await crud.user.remove(db, id=user_id)
     return {"message": "User deleted successfully"}
 
 
@@ -110,11 +124,10 @@ async def activate_user(
     """
     Activate a user. (Admin only)
     """
-    user = await crud.user.get(db, id=user_id)
-    if not user:
+    # Single UPDATE - the rowcount distinguishes missing users
+    updated_count = await User.filter(id=user_id).update(is_active=True)
+    if not updated_count:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    user = await crud.user.activate_user(db, user=user)
     return {"message": "User activated successfully"}
 
 
@@ -127,19 +140,18 @@ async def deactivate_user(
     """
     Deactivate a user. (Admin only)
     """
-    user = await crud.user.get(db, id=user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    if user == current_user:
+    if user_id == current_user.id:
         raise HTTPException(
             status_code=400, detail="Users cannot deactivate themselves"
         )
-    
-    user = await crud.user.deactivate_user(db, user=user)
+
+    updated_count = await User.filter(id=user_id).update(is_active=False)
+    if not updated_count:
+        raise HTTPException(status_code=404, detail="User not found")
+
     # Revoke all refresh tokens when deactivating
-    await crud.refresh_token.revoke_user_tokens(db, user_id=user.id)
-    
+    await RefreshToken.filter(user_id=user_id).update(is_revoked=True)
+
     return {"message": "User deactivated successfully"}
 
 
@@ -152,9 +164,7 @@ async def verify_user(
     """
     Verify a user. (Admin only)
     """
-    user = await crud.user.get(db, id=user_id)
-    if not user:
+    updated_count = await User.filter(id=user_id).update(is_verified=True)
+    if not updated_count:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    user = await crud.user.verify_user(db, user=user)
-    return {"message": "User verified successfully"}
\ No newline at end of file
+    return {"message": "User verified successfully"}
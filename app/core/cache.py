@@ -0,0 +1,236 @@
+import hashlib
+import logging
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_redis_client: Optional[aioredis.Redis] = None
+
+# Small in-process lookaside in front of Redis - repeat hits on hot keys
+# become a dict lookup instead of a network round-trip. Kept deliberately
+# short-lived so staleness stays bounded by the local TTL.
+_LOCAL_TTL_SECONDS = 30
+_LOCAL_MAX_ENTRIES = 1024
+_local_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def _local_get(key: str) -> Optional[Any]:
+    entry = _local_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        _local_cache.pop(key, None)
+        return None
+    return value
+
+
+def _local_set(key: str, value: Any, ttl_seconds: int) -> None:
+    if len(_local_cache) >= _LOCAL_MAX_ENTRIES:
+        # Evict the oldest insertion to bound memory
+        _local_cache.pop(next(iter(_local_cache)), None)
+
+    ttl = min(ttl_seconds, _LOCAL_TTL_SECONDS)
+    _local_cache[key] = (time.monotonic() + ttl, value)
+
+
+def get_redis() -> aioredis.Redis:
+    """
+    Get the shared Redis client (connection pool created lazily on first use)
+
+    The pool is explicitly bounded and kept healthy: connections are reused
+    across requests instead of re-dialed, keepalive stops idle ones being
+    dropped by middleboxes, and the short socket timeouts bound how long a
+    struggling Redis can stall a request - every caller here already treats
+    a cache failure as a miss.
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(
+            settings.REDIS_URL,
+            max_connections=50,
+            socket_keepalive=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+            health_check_interval=30,
+        )
+    return _redis_client
+
+
+# Entries above this size are zlib-compressed before they go to Redis -
+# JSON bodies compress well, so large payloads cost a fraction of the
+# network bandwidth and Redis memory. Small entries aren't worth the CPU.
+# Compressed entries carry a marker prefix; a NUL byte can never start
+# JSON text, so stored payloads are unambiguous either way
+_COMPRESS_MIN_BYTES = 4096
+_COMPRESSED_PREFIX = b"\x00z"
+
+
+def _encode_payload(payload: bytes) -> bytes:
+    if len(payload) >= _COMPRESS_MIN_BYTES:
+        # Level 1 favors speed - the point is shrinking network/Redis
+        # bytes, not maximum ratio
+        compressed = zlib.compress(payload, level=1)
+        if len(compressed) + len(_COMPRESSED_PREFIX) < len(payload):
+            return _COMPRESSED_PREFIX + compressed
+    return payload
+
+
+def _decode_payload(raw: bytes) -> bytes:
+    if raw.startswith(_COMPRESSED_PREFIX):
+        return zlib.decompress(raw[len(_COMPRESSED_PREFIX):])
+    return raw
+
+
+def make_cache_key(prefix: str, payload: Any) -> str:
+    """
+    Build a deterministic cache key from a prefix and request parameters
+    """
+    serialized = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS)
+    # blake2b is noticeably faster per byte than sha256 and a 128-bit
+    # digest is plenty for cache keying - collision resistance at
+    # cryptographic strength is not needed here
+    digest = hashlib.blake2b(serialized, digest_size=16).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+async def get_cached_json(key: str) -> Optional[Any]:
+    """
+    Fetch and deserialize a cached JSON value; returns None on miss.
+
+    Cache failures are logged and treated as misses so Redis being down
+    never breaks a request.
+    """
+    local_value = _local_get(key)
+    if local_value is not None:
+        return local_value
+
+    try:
+        raw = await get_redis().get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+    if raw is None:
+        return None
+
+    try:
+        value = orjson.loads(_decode_payload(raw))
+    except (ValueError, TypeError, zlib.error) as e:
+        logger.warning(f"Discarding unparseable cache entry {key}: {e}")
+        return None
+
+    _local_set(key, value, _LOCAL_TTL_SECONDS)
+    return value
+
+
+async def set_cached_json(key: str, value: Any, ttl_seconds: int = 60) -> None:
+    """
+    Serialize and store a JSON value with a TTL; failures are logged only
+    """
+    _local_set(key, value, ttl_seconds)
+    try:
+        payload = _encode_payload(orjson.dumps(value, default=str))
+        await get_redis().set(key, payload, ex=ttl_seconds)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def get_cached_bytes(key: str) -> Optional[bytes]:
+    """
+    Fetch a cached entry as its raw serialized bytes, skipping the parse.
+
+    Useful when the caller ships the payload onward verbatim (e.g. as an
+    HTTP response body).
+    """
+    local_value = _local_get(key)
+    if isinstance(local_value, bytes):
+        return local_value
+
+    try:
+        raw = await get_redis().get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+    if raw is None:
+        return None
+
+    try:
+        payload = _decode_payload(raw)
+    except zlib.error as e:
+        logger.warning(f"Discarding corrupt cache entry {key}: {e}")
+        return None
+
+    _local_set(key, payload, _LOCAL_TTL_SECONDS)
+    return payload
+
+
+async def set_cached_bytes(key: str, payload: bytes, ttl_seconds: int = 60) -> None:
+    """
+    Store an already-serialized payload with a TTL; failures are logged only
+    """
+    # The local lookaside keeps the uncompressed bytes - compression only
+    # pays for the network hop
+    _local_set(key, payload, ttl_seconds)
+    try:
+        await get_redis().set(key, _encode_payload(payload), ex=ttl_seconds)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def get_namespace_version(namespace: str) -> int:
+    """
+    Current version counter for a cache namespace.
+
+    Keys built with the version baked in can be invalidated wholesale by
+    bumping the counter - no need to enumerate or scan the old keys, they
+    simply fall out via their TTL. Reads go straight to Redis (no local
+    lookaside) so invalidation takes effect immediately.
+    """
+    try:
+        raw = await get_redis().get(f"{namespace}:version")
+    except Exception as e:
+        logger.warning(f"Cache version read failed for {namespace}: {e}")
+        return 0
+    return int(raw) if raw else 0
+
+
+async def bump_namespace_version(namespace: str) -> None:
+    """
+    Invalidate every cache key built with the namespace's current version
+    """
+    try:
+        await get_redis().incr(f"{namespace}:version")
+    except Exception as e:
+        logger.warning(f"Cache version bump failed for {namespace}: {e}")
+
+
+async def delete_cached(*keys: str) -> None:
+    """
+    Invalidate cache entries; multiple keys share one pipelined round-trip
+    """
+    if not keys:
+        return
+
+    for key in keys:
+        _local_cache.pop(key, None)
+
+    try:
+        if len(keys) == 1:
+            await get_redis().delete(keys[0])
+        else:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.delete(key)
+                await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for {len(keys)} keys: {e}")
@@ -3,7 +3,7 @@ from typing import Union
 
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError, ValidationException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -13,7 +13,7 @@ from app.schemas.response import ErrorResponse
 logger = get_logger("error_handler")
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """
     Handle HTTP exceptions with structured error response
     """
@@ -25,7 +25,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         method=request.method,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=ErrorResponse(
             success=False,
@@ -35,13 +35,13 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
                 "code": exc.status_code,
                 "message": exc.detail
             }]
-        ).dict(),
+        ).model_dump(),
     )
 
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle Pydantic validation errors with detailed field information
     """
@@ -62,19 +62,19 @@ async def validation_exception_handler(
         method=request.method,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=ErrorResponse(
             success=False,
             message="Validation failed",
             errors=errors
-        ).dict(),
+        ).model_dump(),
     )
 
 
 async def sqlalchemy_exception_handler(
     request: Request, exc: SQLAlchemyError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle SQLAlchemy database errors
     """
@@ -101,7 +101,7 @@ async def sqlalchemy_exception_handler(
         method=request.method,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=ErrorResponse(
             success=False,
@@ -110,11 +110,11 @@ async def sqlalchemy_exception_handler(
                 "type": "database_error",
                 "message": error_message if status_code != 500 else "Internal server error"
             }]
-        ).dict(),
+        ).model_dump(),
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Handle all other unhandled exceptions
     """
@@ -127,7 +127,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         method=request.method,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=ErrorResponse(
             success=False,
@@ -136,11 +136,11 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
                 "type": "internal_error",
                 "message": "An unexpected error occurred"
             }]
-        ).dict(),
+        ).model_dump(),
     )
 
 
-async def rate_limit_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def rate_limit_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Handle rate limiting errors
     """
@@ -151,7 +151,7 @@ async def rate_limit_exception_handler(request: Request, exc: Exception) -> JSON
         client_ip=request.client.host if request.client else None,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_429_TOO_MANY_REQUESTS,
         content=ErrorResponse(
             success=False,
@@ -160,7 +160,7 @@ async def rate_limit_exception_handler(request: Request, exc: Exception) -> JSON
                 "type": "rate_limit_error",
                 "message": "Too many requests"
             }]
-        ).dict(),
+        ).model_dump(),
         headers={"Retry-After": "60"}  # Suggest retry after 60 seconds
     )
 
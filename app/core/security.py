@@ -1,16 +1,33 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, Dict, Tuple, Union
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt_sha256 pre-hashes the password with SHA-256 before bcrypt, which
+# removes bcrypt's 72-byte truncation and keeps the expensive Eksblowfish
+# expansion working on a fixed-size digest. Existing plain-bcrypt hashes
+# still verify (passlib dispatches on the hash prefix) and are flagged as
+# deprecated so they can be rehashed on the next successful login.
+pwd_context = CryptContext(schemes=["bcrypt_sha256", "bcrypt"], deprecated=["bcrypt"])
 
 
 ALGORITHM = "HS256"
 
+# Small in-process cache of decoded JWT payloads. A token decodes to the
+# same payload every time, so under a refresh storm the repeated HMAC
+# verification is pure wasted CPU. Entries are keyed by a token digest and
+# live only a few seconds; revocation stays a live database check, this
+# only skips the crypto. A payload can outlive its exp claim by at most
+# the cache TTL, which is well inside normal clock skew.
+_DECODE_TTL_SECONDS = 5
+_DECODE_MAX_ENTRIES = 1024
+_decode_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 
 def create_access_token(
     subject: Union[str, Any], expires_delta: timedelta = None
@@ -48,6 +65,38 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a stored hash uses a deprecated scheme and should be redone"""
+    return pwd_context.needs_update(hashed_password)
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT, returning its full payload.
+
+    Recently verified tokens are served from the in-process cache so the
+    signature check runs once per token per few seconds rather than on
+    every request. Raises jwt.JWTError for an invalid or expired token.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    now = time.monotonic()
+
+    entry = _decode_cache.get(key)
+    if entry is not None:
+        expires_at, payload = entry
+        if expires_at >= now:
+            return payload
+        _decode_cache.pop(key, None)
+
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+
+    if len(_decode_cache) >= _DECODE_MAX_ENTRIES:
+        # Evict the oldest insertion to bound memory
+        _decode_cache.pop(next(iter(_decode_cache)), None)
+    _decode_cache[key] = (now + _DECODE_TTL_SECONDS, payload)
+    return payload
+
+
 def verify_token(token: str, token_type: str = "access") -> Union[str, None]:
     try:
         payload = jwt.decode(
@@ -1,6 +1,10 @@
+import asyncio
 from typing import Optional
 from app.models.models import User, RefreshToken
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, password_needs_rehash, verify_password
+
+# bcrypt hashing/verification is deliberately slow CPU work - run it in a
+# worker thread so it doesn't stall the event loop for every other request
 
 class TortoiseUserCRUD:
     async def get_by_email(self, email: str) -> Optional[User]:
@@ -9,11 +13,11 @@ class TortoiseUserCRUD:
     async def get_by_id(self, user_id: int) -> Optional[User]:
         return await User.get_or_none(id=user_id)
 
-    async def create(self, email: str, username: str, password: str, full_name: str = None) -> User:
+    async def create(self, email: str, password: str, full_name: str = None) -> User:
+        hashed_password = await asyncio.to_thread(get_password_hash, password)
         user = await User.create(
             email=email,
-            username=username,
-            hashed_password=get_password_hash(password),
+            hashed_password=hashed_password,
             full_name=full_name,
             is_active=True
         )
@@ -21,8 +25,15 @@ class TortoiseUserCRUD:
 
     async def authenticate(self, email: str, password: str) -> Optional[User]:
         user = await self.get_by_email(email=email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await asyncio.to_thread(verify_password, password, user.hashed_password):
             return None
+
+        # Opportunistically migrate hashes stored under a deprecated scheme
+        # (plain bcrypt) to the current one while we hold the plaintext
+        if password_needs_rehash(user.hashed_password):
+            user.hashed_password = await asyncio.to_thread(get_password_hash, password)
+            await user.save(update_fields=["hashed_password"])
+
         return user
 
     async def is_active(self, user: User) -> bool:
@@ -32,7 +43,7 @@ class TortoiseUserCRUD:
         return user.is_superuser
 
     async def update_password(self, user: User, new_password: str) -> User:
-        user.hashed_password = get_password_hash(new_password)
+        user.hashed_password = await asyncio.to_thread(get_password_hash, new_password)
         await user.save()
         return user
 
@@ -1,9 +1,9 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 # Removed broken FastAPI Admin
 from tortoise.contrib.fastapi import register_tortoise
 from tortoise import Tortoise
@@ -90,6 +90,9 @@ def create_application() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        # orjson serializes large nested responses several times faster
+        # than the stdlib json encoder
+        default_response_class=ORJSONResponse,
     )
 
     # Set up CORS
@@ -162,7 +165,7 @@ async def health_check():
     """
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=datetime.now(timezone.utc).isoformat(),
         version=settings.API_VERSION,
         environment="development" if not settings.TESTING else "testing"
     )
@@ -189,7 +192,7 @@ async def detailed_health_check():
     
     return {
         "status": overall_status,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "version": settings.API_VERSION,
         "checks": checks,
     }
@@ -35,6 +35,7 @@ from .models import (
     # Polymorphic models (new architecture)
     UniversalBooking,
     UniversalPriceHistory,
+    HotelPriceDailyLatest,
     UniversalPriceAlert,
     BookableType,
     TrackableType,
@@ -88,6 +89,7 @@ __all__ = [
     # Polymorphic models (new architecture)
     "UniversalBooking",
     "UniversalPriceHistory",
+    "HotelPriceDailyLatest",
     "UniversalPriceAlert",
     "BookableType",
     "TrackableType",
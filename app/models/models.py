@@ -199,6 +199,7 @@ class User(Model):
     hashed_password = fields.CharField(max_length=255)
     full_name = fields.CharField(max_length=100, null=True)
     is_active = fields.BooleanField(default=True)
+    is_verified = fields.BooleanField(default=False)
     is_superuser = fields.BooleanField(default=False)
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
@@ -777,11 +778,47 @@ class UniversalPriceHistory(Model):
     class Meta:
         table = "universal_price_history"
         unique_together = (("trackable_type", "trackable_id", "secondary_trackable_id", "price_date", "search_date", "search_end_date", "data_source"),)
+        indexes = (
+            ("trackable_id", "price_date", "recorded_at"),
+            # Recommendation fallback query: filter on type + date, ordered
+            # by price - the trailing price column lets the LIMIT walk the
+            # index instead of sorting
+            ("trackable_type", "price_date", "price"),
+        )
 
     def __str__(self):
         return f"{self.trackable_type} - {self.price} {self.currency} ({self.search_date})"
 
 
+class HotelPriceDailyLatest(Model):
+    """Latest observed price per (property, stay date, currency).
+
+    Application-maintained rollup of UniversalPriceHistory so read paths can
+    do an indexed range scan instead of deduplicating the full history per
+    request. Rows are upserted whenever a new price observation is saved.
+    """
+    id = fields.IntField(pk=True)
+    trackable_type = fields.CharEnumField(TrackableType, default=TrackableType.HOTEL_ROOM)
+    trackable_id = fields.IntField(null=True)
+    property_name = fields.CharField(max_length=255)
+    price_date = fields.DateField()
+    price = fields.DecimalField(max_digits=12, decimal_places=2)
+    currency = fields.CharField(max_length=3, default="USD")
+    is_available = fields.BooleanField(default=True)
+    search_criteria = fields.JSONField(null=True)
+    data_source = fields.CharField(max_length=100)
+    recorded_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "hotel_price_daily_latest"
+        unique_together = (("property_name", "price_date", "currency"),)
+        # Recommendation hot path: filter on type + date, ordered by price
+        indexes = (("trackable_type", "price_date", "price"),)
+
+    def __str__(self):
+        return f"{self.property_name} - {self.price} {self.currency} ({self.price_date})"
+
+
 class UniversalPriceAlert(Model):
     id = fields.IntField(pk=True)
     booking = fields.ForeignKeyField("models.UniversalBooking", related_name="price_alerts", on_delete=fields.CASCADE)
@@ -932,7 +969,10 @@ class TrackerResult(Model):
         table = "tracker_results"
 
     def __str__(self):
-        return f"{self.tracker.name} - {self.run_id}"
+        # Use the FK id rather than self.tracker.name - the relation is not
+        # fetched on results loaded in bulk, so touching it here would need
+        # one extra query (or raise) per row that gets logged or repr'd
+        return f"Tracker {self.tracker_id} - {self.run_id}"
 
 
 class TrackerAlert(Model):
@@ -4,16 +4,10 @@ from typing import Optional
 from pydantic import BaseModel, EmailStr, Field
 
 
-# Shared properties
+# Shared properties - mirrors the columns the User model actually has
 class UserBase(BaseModel):
     email: EmailStr
-    username: Optional[str] = None
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
-    phone_number: Optional[str] = None
-    bio: Optional[str] = None
-    timezone: str = "UTC"
-    locale: str = "en"
+    full_name: Optional[str] = None
     is_active: bool = True
 
 
@@ -26,13 +20,7 @@ class UserCreate(UserBase):
 # Properties to receive via API on update
 class UserUpdate(BaseModel):
     email: Optional[EmailStr] = None
-    username: Optional[str] = None
-    first_name: Optional[str] = None
-    last_name: Optional[str] = None
-    phone_number: Optional[str] = None
-    bio: Optional[str] = None
-    timezone: Optional[str] = None
-    locale: Optional[str] = None
+    full_name: Optional[str] = None
     is_active: Optional[bool] = None
 
 
@@ -49,8 +37,6 @@ class UserResponse(UserBase):
     is_superuser: bool
     created_at: datetime
     updated_at: datetime
-    last_login: Optional[datetime]
-    profile_picture_url: Optional[str]
 
     class Config:
         from_attributes = True
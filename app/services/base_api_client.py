@@ -1,7 +1,7 @@
 import asyncio
 import time
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import httpx
 import logging
@@ -9,6 +9,14 @@ from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
+# Static header set shared by every request - built once at import and
+# copied per call instead of re-created as a dict literal
+_BASE_HEADERS = {
+    'Accept': 'application/json',
+    'Authorization-Type': 'external-service',
+    'source': 'website'
+}
+
 
 class TokenManager:
     """Manages API tokens with automatic refresh capabilities"""
@@ -22,7 +30,7 @@ class TokenManager:
     def set_tokens(self, access_token: str, expires_in: int, refresh_token: Optional[str] = None):
         """Set access token with expiry time"""
         self._access_token = access_token
-        self._token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in - 60)  # 60s buffer
+        self._token_expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in - 60)  # 60s buffer
         if refresh_token:
             self._refresh_token = refresh_token
     
@@ -30,7 +38,7 @@ class TokenManager:
         """Check if current token is expired or about to expire"""
         if not self._access_token or not self._token_expires_at:
             return True
-        return datetime.utcnow() >= self._token_expires_at
+        return datetime.now(timezone.utc) >= self._token_expires_at
     
     def get_access_token(self) -> Optional[str]:
         """Get current access token"""
@@ -60,15 +68,11 @@ class BaseApiClient:
     
     def get_default_headers(self, token: Optional[str] = None) -> Dict[str, str]:
         """Get default headers for requests"""
-        headers = {
-            'Accept': 'application/json',
-            'Authorization-Type': 'external-service',
-            'source': 'website'
-        }
-        
+        headers = _BASE_HEADERS.copy()
+
         if token:
             headers['Authorization'] = f'Bearer {token}'
-        
+
         return headers
     
     async def make_request(
@@ -96,18 +100,21 @@ class BaseApiClient:
         # Get the current token
         token = self.token_manager.get_access_token()
         
+        # Normalize the method once instead of re-lowercasing it per branch
+        method_lower = method.lower()
+
         headers = self.get_default_headers(token)
-        if method.lower() in ['post', 'put', 'patch']:
+        if method_lower in ('post', 'put', 'patch'):
             headers['Content-Type'] = 'application/json'
-        
+
         try:
-            if method.lower() == 'get':
+            if method_lower == 'get':
                 response = await self._client.get(url, headers=headers, params=params)
-            elif method.lower() == 'post':
+            elif method_lower == 'post':
                 response = await self._client.post(url, headers=headers, json=data)
-            elif method.lower() == 'put':
+            elif method_lower == 'put':
                 response = await self._client.put(url, headers=headers, json=data)
-            elif method.lower() == 'delete':
+            elif method_lower == 'delete':
                 response = await self._client.delete(url, headers=headers, json=data)
             else:
                 raise HTTPException(status_code=400, detail=f"Unsupported HTTP method: {method}")
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
@@ -287,14 +287,14 @@ class SerpApiService:
         params = self._build_search_params(criteria)
 
         try:
-            logger.info(f"Searching hotels with query: {criteria.query}")
+            logger.info("Searching hotels with query: %s", criteria.query)
             response = await self.client.get(self.base_url, params=params)
             response.raise_for_status()
 
             data = response.json()
 
             # Add search metadata to properties for tracking
-            search_date = datetime.utcnow()
+            search_date = datetime.now(timezone.utc)
             for prop in data.get("properties", []):
                 prop["search_query"] = criteria.query
                 prop["search_date"] = search_date.isoformat()
@@ -314,7 +314,7 @@ class SerpApiService:
         params["property_token"] = property_token
 
         try:
-            logger.info(f"Getting property details for token: {property_token}")
+            logger.info("Getting property details for token: %s", property_token)
             response = await self.client.get(self.base_url, params=params)
             response.raise_for_status()
 
@@ -349,7 +349,7 @@ class SerpApiService:
                 data = response.json()
 
                 # Add search metadata to properties
-                search_date = datetime.utcnow()
+                search_date = datetime.now(timezone.utc)
                 for prop in data.get("properties", []):
                     prop["search_query"] = criteria.query
                     prop["search_date"] = search_date.isoformat()
@@ -361,9 +361,9 @@ class SerpApiService:
                 if (serp_response.serpapi_pagination and
                     serp_response.serpapi_pagination.next_page_token):
                     next_page_token = serp_response.serpapi_pagination.next_page_token
-                    logger.info(f"Found next page token, continuing to page {page + 2}")
+                    logger.info("Found next page token, continuing to page %s", page + 2)
                 else:
-                    logger.info(f"No more pages available, stopping at page {page + 1}")
+                    logger.info("No more pages available, stopping at page %s", page + 1)
                     break
 
             except httpx.HTTPError as e:
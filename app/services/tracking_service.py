@@ -1,12 +1,15 @@
 import asyncio
 import logging
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
+from tortoise.expressions import F
+
 from app.models.models import (
-    Tracker, TrackerResult, UniversalPriceHistory,
+    Tracker, TrackerResult, UniversalPriceHistory, HotelPriceDailyLatest,
     Hotel, Country, Destination, Area, TrackableType
 )
 from app.services.serp_service import (
@@ -22,6 +25,20 @@ class TrackingError(Exception):
     pass
 
 
+@lru_cache(maxsize=1024)
+def _date_range_ordinals(
+    start_ordinal: int,
+    end_ordinal: int,
+    interval_days: int,
+    stay_duration_days: int
+) -> tuple[tuple[int, int], ...]:
+    """Memoized (check-in, check-out) ordinal pairs for a tracking window"""
+    return tuple(
+        (check_in, check_in + stay_duration_days)
+        for check_in in range(start_ordinal, end_ordinal + 1, interval_days)
+    )
+
+
 @dataclass
 class TrackingTask:
     """Represents a single tracking task"""
@@ -55,7 +72,7 @@ class HotelTrackingService:
         run_id = f"{tracker.id}_{int(start_time.timestamp())}"
 
         try:
-            logger.info(f"Starting tracker run: {tracker.name} (ID: {tracker.id})")
+            logger.info("Starting tracker run: %s (ID: %s)", tracker.name, tracker.id)
 
             # Parse search parameters from tracker
             search_params = self._parse_tracker_parameters(tracker)
@@ -99,7 +116,7 @@ class HotelTrackingService:
                     successful_searches += 1
 
                     logger.info(
-                        f"Processed {items_saved} items for {check_in} to {check_out}"
+                        "Processed %s items for %s to %s", items_saved, check_in, check_out
                     )
 
                     # Add delay between requests to respect rate limits
@@ -131,8 +148,8 @@ class HotelTrackingService:
             await self._update_tracker_stats(tracker, result.success)
 
             logger.info(
-                f"Completed tracker run: {tracker.name}, "
-                f"found {total_items_found} items in {execution_time:.2f}s"
+                "Completed tracker run: %s, found %s items in %.2fs",
+                tracker.name, total_items_found, execution_time
             )
 
             return result
@@ -167,8 +184,8 @@ class HotelTrackingService:
 
             # Required parameters
             query = params.get("query") or tracker.name
-            start_date = datetime.fromisoformat(params["start_date"]).date()
-            end_date = datetime.fromisoformat(params["end_date"]).date()
+            start_date = date.fromisoformat(params["start_date"])
+            end_date = date.fromisoformat(params["end_date"])
 
             # Optional parameters
             interval_days = params.get("interval_days", 1)
@@ -203,20 +220,20 @@ class HotelTrackingService:
         stay_duration_days: int = 1
     ) -> List[tuple[date, date]]:
         """Generate date ranges for interval tracking"""
-        date_ranges = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            check_out_date = current_date + timedelta(days=stay_duration_days)
-
-            # Don't exceed the end date
-            if check_out_date > end_date + timedelta(days=stay_duration_days):
-                break
-
-            date_ranges.append((current_date, check_out_date))
-            current_date += timedelta(days=interval_days)
+        # The ordinal pairs are memoized per (window, interval, stay) since
+        # trackers re-run over the same windows; only the date objects are
+        # materialized per call
+        ordinal_pairs = _date_range_ordinals(
+            start_date.toordinal(),
+            end_date.toordinal(),
+            interval_days,
+            stay_duration_days
+        )
 
-        return date_ranges
+        return [
+            (date.fromordinal(check_in), date.fromordinal(check_out))
+            for check_in, check_out in ordinal_pairs
+        ]
 
     async def _process_search_results(
         self,
@@ -226,17 +243,20 @@ class HotelTrackingService:
         criteria: SearchCriteria
     ) -> int:
         """Process search results and save to price history"""
-        items_saved = 0
+        # Build all rows first, then insert the page in one batch instead
+        # of paying a round-trip per property
+        entries = []
 
         # Process main properties
         for property_result in response.properties:
             try:
-                await self._save_price_history(
+                entry = self._build_price_history_entry(
                     property_result, tracker, run_id, criteria
                 )
-                items_saved += 1
+                if entry:
+                    entries.append(entry)
             except Exception as e:
-                logger.warning(f"Failed to save property {property_result.name}: {e}")
+                logger.warning(f"Failed to process property {property_result.name}: {e}")
                 continue
 
         # Process ads if they contain pricing info
@@ -244,24 +264,72 @@ class HotelTrackingService:
             try:
                 if ad_result.extracted_price:
                     # Convert ad to property-like structure for saving
-                    await self._save_ad_price_history(
+                    entries.append(self._build_ad_price_history_entry(
                         ad_result, tracker, run_id, criteria
-                    )
-                    items_saved += 1
+                    ))
             except Exception as e:
-                logger.warning(f"Failed to save ad {ad_result.name}: {e}")
+                logger.warning(f"Failed to process ad {ad_result.name}: {e}")
                 continue
 
-        return items_saved
+        if not entries:
+            return 0
+
+        # ignore_conflicts keeps the old per-row behaviour where a
+        # duplicate recording was skipped without failing the rest
+        await UniversalPriceHistory.bulk_create(
+            [history_row for history_row, _ in entries],
+            batch_size=100,
+            ignore_conflicts=True,
+        )
+
+        # Keep the latest-price rollup current for fast read paths - dedupe
+        # per (property, date, currency) first so one batched upsert covers
+        # the page; the last observation wins, matching the old serial order
+        latest_rollups = {}
+        for _, rollup_kwargs in entries:
+            key = (
+                rollup_kwargs["property_name"],
+                rollup_kwargs["price_date"],
+                rollup_kwargs["currency"],
+            )
+            latest_rollups[key] = rollup_kwargs
+        await self._upsert_daily_latest(list(latest_rollups.values()))
+
+        return len(entries)
+
+    async def _upsert_daily_latest(self, rollups: List[Dict[str, Any]]) -> None:
+        """Upsert the latest-price rollup rows for a page of observations.
+
+        One batched INSERT ... ON CONFLICT DO UPDATE against the
+        (property_name, price_date, currency) unique constraint, instead of
+        a SELECT-plus-write round-trip per property.
+        """
+        if not rollups:
+            return
 
-    async def _save_price_history(
+        await HotelPriceDailyLatest.bulk_create(
+            [
+                HotelPriceDailyLatest(
+                    trackable_type=TrackableType.HOTEL_ROOM, **rollup_kwargs
+                )
+                for rollup_kwargs in rollups
+            ],
+            batch_size=100,
+            on_conflict=["property_name", "price_date", "currency"],
+            update_fields=[
+                "trackable_type", "price", "is_available",
+                "data_source", "search_criteria", "recorded_at",
+            ],
+        )
+
+    def _build_price_history_entry(
         self,
         property_result: PropertyResult,
         tracker: Tracker,
         run_id: str,
         criteria: SearchCriteria
-    ) -> None:
-        """Save property result to price history"""
+    ) -> Optional[tuple]:
+        """Build the unsaved price history row and rollup data for a property"""
 
         # Extract price information
         price = None
@@ -274,13 +342,32 @@ class HotelTrackingService:
 
         if price is None:
             logger.warning(f"No price found for property: {property_result.name}")
-            return
+            return None
 
         # Determine availability
         is_available = price > 0
 
-        # Create price history entry
-        await UniversalPriceHistory.create(
+        search_criteria = {
+            "property_name": property_result.name,
+            "property_type": property_result.type,
+            "query": criteria.query,
+            "check_in_date": criteria.check_in_date.isoformat(),
+            "check_out_date": criteria.check_out_date.isoformat(),
+            "adults": criteria.adults,
+            "children": criteria.children,
+            "overall_rating": property_result.overall_rating,
+            "reviews": property_result.reviews,
+            "hotel_class": property_result.extracted_hotel_class,
+            "amenities": property_result.amenities,
+            "gps_coordinates": property_result.gps_coordinates.dict() if property_result.gps_coordinates else None,
+            "property_token": property_result.property_token,
+            "images": [img.dict() for img in property_result.images] if property_result.images else [],
+            "main_image": property_result.original_image,
+            "run_id": run_id,
+            "tracker_id": tracker.id,
+        }
+
+        history_row = UniversalPriceHistory(
             trackable_type=TrackableType.HOTEL_ROOM,
             trackable_id=None,  # We don't have hotel ID from SERP
             price=price,
@@ -289,41 +376,54 @@ class HotelTrackingService:
             price_date=criteria.check_in_date,
             search_date=criteria.check_in_date,
             data_source="serpapi",
-            search_criteria={
-                "property_name": property_result.name,
-                "property_type": property_result.type,
-                "query": criteria.query,
-                "check_in_date": criteria.check_in_date.isoformat(),
-                "check_out_date": criteria.check_out_date.isoformat(),
-                "adults": criteria.adults,
-                "children": criteria.children,
-                "overall_rating": property_result.overall_rating,
-                "reviews": property_result.reviews,
-                "hotel_class": property_result.extracted_hotel_class,
-                "amenities": property_result.amenities,
-                "gps_coordinates": property_result.gps_coordinates.dict() if property_result.gps_coordinates else None,
-                "property_token": property_result.property_token,
-                "images": [img.dict() for img in property_result.images] if property_result.images else [],
-                "main_image": property_result.original_image,
-                "run_id": run_id,
-                "tracker_id": tracker.id,
-            }
+            search_criteria=search_criteria
         )
 
-    async def _save_ad_price_history(
+        rollup_kwargs = {
+            "property_name": property_result.name,
+            "price": price,
+            "currency": currency,
+            "is_available": is_available,
+            "price_date": criteria.check_in_date,
+            "data_source": "serpapi",
+            "search_criteria": search_criteria,
+        }
+
+        return history_row, rollup_kwargs
+
+    def _build_ad_price_history_entry(
         self,
         ad_result,
         tracker: Tracker,
         run_id: str,
         criteria: SearchCriteria
-    ) -> None:
-        """Save ad result to price history"""
+    ) -> tuple:
+        """Build the unsaved price history row and rollup data for an ad"""
 
         price = ad_result.extracted_price
         currency = criteria.currency
         is_available = price > 0
 
-        await UniversalPriceHistory.create(
+        search_criteria = {
+            "property_name": ad_result.name,
+            "source": ad_result.source,
+            "query": criteria.query,
+            "check_in_date": criteria.check_in_date.isoformat(),
+            "check_out_date": criteria.check_out_date.isoformat(),
+            "adults": criteria.adults,
+            "children": criteria.children,
+            "overall_rating": ad_result.overall_rating,
+            "reviews": ad_result.reviews,
+            "hotel_class": ad_result.hotel_class,
+            "amenities": ad_result.amenities,
+            "gps_coordinates": ad_result.gps_coordinates.dict() if ad_result.gps_coordinates else None,
+            "property_token": ad_result.property_token,
+            "run_id": run_id,
+            "tracker_id": tracker.id,
+            "is_ad": True,
+        }
+
+        history_row = UniversalPriceHistory(
             trackable_type=TrackableType.HOTEL_ROOM,
             trackable_id=None,
             price=price,
@@ -332,47 +432,46 @@ class HotelTrackingService:
             price_date=criteria.check_in_date,
             search_date=criteria.check_in_date,
             data_source="serpapi_ads",
-            search_criteria={
-                "property_name": ad_result.name,
-                "source": ad_result.source,
-                "query": criteria.query,
-                "check_in_date": criteria.check_in_date.isoformat(),
-                "check_out_date": criteria.check_out_date.isoformat(),
-                "adults": criteria.adults,
-                "children": criteria.children,
-                "overall_rating": ad_result.overall_rating,
-                "reviews": ad_result.reviews,
-                "hotel_class": ad_result.hotel_class,
-                "amenities": ad_result.amenities,
-                "gps_coordinates": ad_result.gps_coordinates.dict() if ad_result.gps_coordinates else None,
-                "property_token": ad_result.property_token,
-                "run_id": run_id,
-                "tracker_id": tracker.id,
-                "is_ad": True,
-            }
+            search_criteria=search_criteria
         )
 
-    async def _update_tracker_stats(self, tracker: Tracker, success: bool) -> None:
-        """Update tracker statistics"""
-        tracker.total_runs += 1
-        tracker.last_run_at = datetime.utcnow()
+        rollup_kwargs = {
+            "property_name": ad_result.name,
+            "price": price,
+            "currency": currency,
+            "is_available": is_available,
+            "price_date": criteria.check_in_date,
+            "data_source": "serpapi_ads",
+            "search_criteria": search_criteria,
+        }
+
+        return history_row, rollup_kwargs
 
+    async def _update_tracker_stats(self, tracker: Tracker, success: bool) -> None:
+        """Update tracker statistics with a single SQL UPDATE"""
+        updates = {
+            "total_runs": F("total_runs") + 1,
+            "last_run_at": datetime.utcnow(),
+        }
         if success:
-            tracker.successful_runs += 1
+            updates["successful_runs"] = F("successful_runs") + 1
 
-        await tracker.save()
+        await Tracker.filter(id=tracker.id).update(**updates)
 
     async def run_multiple_trackers(self, tracker_ids: List[int]) -> List[TrackerResult]:
         """Run multiple trackers concurrently"""
-        # Fetch trackers
-        trackers = []
-        for tracker_id in tracker_ids:
-            tracker = await Tracker.get_or_none(id=tracker_id, status="active")
-            if tracker:
-                trackers.append(tracker)
-            else:
-                logger.warning(f"Tracker {tracker_id} not found or not active")
+        # Fetch all requested trackers in a single query instead of one
+        # round-trip per ID
+        trackers = await Tracker.filter(id__in=tracker_ids, status="active")
+
+        missing_ids = set(tracker_ids) - {tracker.id for tracker in trackers}
+        for tracker_id in missing_ids:
+            logger.warning(f"Tracker {tracker_id} not found or not active")
 
+        return await self._run_trackers(trackers)
+
+    async def _run_trackers(self, trackers: List[Tracker]) -> List[TrackerResult]:
+        """Run already-fetched trackers concurrently"""
         if not trackers:
             logger.warning("No active trackers found to run")
             return []
@@ -416,10 +515,11 @@ class HotelTrackingService:
             logger.info("No trackers due for execution")
             return []
 
-        logger.info(f"Running {len(due_trackers)} scheduled trackers")
-        tracker_ids = [t.id for t in due_trackers]
+        logger.info("Running %s scheduled trackers", len(due_trackers))
 
-        return await self.run_multiple_trackers(tracker_ids)
+        # The due trackers are already loaded - run them directly instead of
+        # re-fetching each one by ID
+        return await self._run_trackers(due_trackers)
 
     def _is_tracker_due(self, tracker: Tracker) -> bool:
         """Check if a tracker is due for execution"""
@@ -432,6 +532,15 @@ class HotelTrackingService:
         return time_since_last_run.total_seconds() > 3600  # 1 hour
 
 
+# Shared instance for the FastAPI dependency - the service carries no
+# per-request state, so constructing it (and its SerpApi client) on every
+# request was pure allocation overhead
+_tracking_service: Optional[HotelTrackingService] = None
+
+
 async def get_tracking_service() -> HotelTrackingService:
-    """Get configured tracking service instance"""
-    return HotelTrackingService()
\ No newline at end of file
+    """Get the shared tracking service instance (created lazily on first use)"""
+    global _tracking_service
+    if _tracking_service is None:
+        _tracking_service = HotelTrackingService()
+    return _tracking_service
\ No newline at end of file
@@ -11,6 +11,19 @@ from .base_api_client import BaseApiClient
 
 logger = logging.getLogger(__name__)
 
+# Default search filters applied when the caller does not override them.
+# Built once at import time so the hot search path only merges dicts.
+DEFAULT_SEARCH_FILTERS = {
+    'filterBy': {
+        'subLocationIds': None,
+        'ratings': [4, 5],
+        'facilities': None,
+        'type': None,
+        'tags': None,
+        'reviewRatings': None
+    }
+}
+
 
 class TravClanTokenManager:
     """Singleton token manager for TravClan API"""
@@ -198,20 +211,11 @@ class TravClanHotelApiService(BaseApiClient):
     # Hotel Search
     async def search_hotels(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """Search for hotels"""
-        default_payload = {
-            'filterBy': {
-                'subLocationIds': None,
-                'ratings': [4, 5],
-                'facilities': None,
-                'type': None,
-                'tags': None,
-                'reviewRatings': None
-            }
-        }
-        
-        payload = {**default_payload, **request_data}
+        payload = {**DEFAULT_SEARCH_FILTERS, **request_data}
         
-        logger.info(f"TravClan searchHotels payload: {payload}")
+        # Lazy formatting - repr of the full payload is only built when the
+        # INFO level is actually enabled
+        logger.info("TravClan searchHotels payload: %s", payload)
         
         try:
             response = await self.make_request(
@@ -0,0 +1,25 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "hotel_price_daily_latest" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "trackable_type" VARCHAR(10) NOT NULL DEFAULT 'hotel_room' /* HOTEL_ROOM: hotel_room\nFLIGHT: flight\nPACKAGE: package\nACTIVITY: activity */,
+    "trackable_id" INT,
+    "property_name" VARCHAR(255) NOT NULL,
+    "price_date" DATE NOT NULL,
+    "price" VARCHAR(40) NOT NULL,
+    "currency" VARCHAR(3) NOT NULL DEFAULT 'USD',
+    "is_available" INT NOT NULL DEFAULT 1,
+    "search_criteria" JSON,
+    "data_source" VARCHAR(100) NOT NULL,
+    "recorded_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT "uid_hotel_price_propert_d41a1c" UNIQUE ("property_name", "price_date", "currency")
+);
+CREATE INDEX IF NOT EXISTS "idx_hotel_price_daily_latest_type_date" ON "hotel_price_daily_latest" ("trackable_type", "price_date");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "hotel_price_daily_latest";"""
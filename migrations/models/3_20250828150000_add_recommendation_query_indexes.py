@@ -0,0 +1,13 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_universal_price_history_type_date_price" ON "universal_price_history" ("trackable_type", "price_date", "price");
+        CREATE INDEX IF NOT EXISTS "idx_hotel_price_daily_latest_type_date_price" ON "hotel_price_daily_latest" ("trackable_type", "price_date", "price");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_universal_price_history_type_date_price";
+        DROP INDEX IF EXISTS "idx_hotel_price_daily_latest_type_date_price";"""